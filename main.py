@@ -1,17 +1,391 @@
+import asyncio
 import decky
+import functools
+import hashlib
+import heapq
 import os
 import subprocess
 import shutil
+import struct
 from pathlib import Path
 import json
-import glob
+
+try:
+    # Optional fast JSON decoder; the stdlib is the fallback everywhere
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+import math
+import mmap
 import re
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Matches the key/value pairs we care about in libraryfolders.vdf and
+# appmanifest_*.acf; scanning the whole file with one compiled regex is far
+# cheaper than splitting every line in Python. The value group tolerates
+# VDF escape sequences (\\ and \") without truncating at the escaped quote.
+_VDF_KV = re.compile(rb'"(path|appid|name|installdir)"[ \t]*"((?:[^"\\]|\\.)*)"')
+# libraryfolders.vdf scan: "path" entries plus the numeric "appid" "size"
+# pairs inside each library's "apps" block (the numeric library index keys
+# are followed by "{", not a quoted value, so they never match)
+_VDF_LIB_KV = re.compile(rb'"(path|\d+)"[ \t]*"((?:[^"\\]|\\.)*)"')
+# CamelCase-aware tokenizer: "AmongUs2" -> ["Among", "Us", "2"], so exe stems
+# without spaces still yield word-match signal against the game name
+_TOKEN_RE = re.compile(r'[A-Z][a-z]+|[A-Z]+(?![a-z])|[a-z]+|[0-9]+')
+
+# Substrings that mark an executable as a utility rather than the game itself;
+# the compiled alternation scans a lowercased name in one C-level pass
+_SKIP_TOKENS = ("unins", "launcher", "crash", "setup", "config", "redist", "install")
+_SKIP_RE = re.compile("|".join(_SKIP_TOKENS))
+# Variants used by the other finders; one compiled alternation scans the
+# name once instead of a Python any() loop of substring searches
+# ("redist" already covers "vcredist")
+_SKIP_UTILITY_RE = re.compile("unins|launcher|crash|setup|config|redist")
+_SKIP_INSTALLER_RE = re.compile("unins|redist|directx|setup|install")
+_SKIP_OBVIOUS_RE = re.compile("unins|setup|redist|directx")
+
+# Generic executable names that earn a "likely the game" bonus
+_COMMON_EXE_NAMES = frozenset({"game", "start", "play", "client", "app"})
+_COMMON_EXE_RE = re.compile("game|main|client|app|play")
+
+# Normalization helpers shared by the name-matching heuristics; compiled once
+# so the per-executable scoring loops skip the re cache lookup entirely
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_ALNUM_RUN_RE = re.compile(r'[a-z0-9]+')
+
+# Quoted .exe paths as they appear in Steam's console log lines
+_LOG_EXE_SQ_RE = re.compile(r"'([^']*\.exe)'")
+_LOG_EXE_DQ_RE = re.compile(r'"([^"]*\.exe)"')
+
+# Directory names that never contain the game executable; pruning them keeps
+# walks out of runtime/anticheat trees with thousands of files
+_SKIP_DIR_NAMES = frozenset({
+    "redist", "_commonredist", "commonredist", "monobleedingedge",
+    "easyanticheat", "battleye", "crashpad", "directx", "dotnet", "vcredist",
+})
+
+# Well-known Valve runtime/tool appids (Proton builds, Steam Linux Runtime,
+# redistributables); their manifests are skipped without even being opened.
+# The name-substring filter in list_installed_games still catches unknown ones.
+_IGNORED_APPIDS = frozenset({
+    "228980",   # Steamworks Common Redistributables
+    "1070560",  # Steam Linux Runtime 1.0 (scout)
+    "1391110",  # Steam Linux Runtime 2.0 (soldier)
+    "1628350",  # Steam Linux Runtime 3.0 (sniper)
+    "1161040",  # Proton BattlEye Runtime
+    "1826330",  # Proton EasyAntiCheat Runtime
+    "1245040",  # Proton 5.0
+    "1420170",  # Proton 5.13
+    "1580130",  # Proton 6.3
+    "1887720",  # Proton 7.0
+    "2348590",  # Proton 8.0
+    "2805730",  # Proton 9.0
+    "1493710",  # Proton Experimental
+    "2180100",  # Proton Hotfix
+})
+
+# Resolve $HOME once at import; expanduser/expandvars re-read the
+# environment on every call
+_HOME = os.environ.get("HOME", os.path.expanduser("~"))
+_XDG_DATA_HOME = os.environ.get("XDG_DATA_HOME") or f"{_HOME}/.local/share"
+_RESHADE_PATH = f"{_XDG_DATA_HOME}/reshade"
+# Heroic flatpak config root; every Heroic lookup hangs off this directory
+_HEROIC_CONFIG = f"{_HOME}/.var/app/com.heroicgameslauncher.hgl/config/heroic"
+
+# Files dropped into a game directory by a ReShade install; scanned for by
+# name during uninstall (ReShadePreset.ini is deliberately absent so user
+# presets survive)
+_RESHADE_FILES = frozenset({
+    "d3d8.dll", "d3d9.dll", "d3d10.dll", "d3d11.dll", "d3d12.dll",
+    "dxgi.dll", "opengl32.dll", "dinput8.dll", "ddraw.dll",
+    "d3dcompiler_47.dll", "ReShade.ini", "ReShade_README.txt",
+    "AutoHDR.addon32", "AutoHDR.addon64",
+})
+
+# Name fragments of system components and redistributables that should
+# never be offered for ReShade modding
+_EXCLUDED_NAME_PARTS = (
+    "Proton",
+    "Steam Linux Runtime",
+    "Steamworks Common Redistributables",
+    "DirectX",
+    "Visual C++",
+    ".NET Framework",
+    "OpenXR",
+)
+
+# Directories inside the Heroic install root that never contain a game
+_HEROIC_NON_GAME_DIRS = frozenset({"prefixes", "temp", "legendary", "gog", "state", "logs"})
+
+
+# Deletion table for _normalize_string; one C-level pass instead of three
+# chained str.replace scans
+_NORM_DELETE = str.maketrans("", "", " -_")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_string(value: str) -> str:
+    """Lowercase *value* and strip spaces, dashes and underscores
+
+    The Heroic matchers normalize the same titles and folder names over and
+    over while comparing games against configs; the cache makes repeats free.
+    """
+    return value.lower().translate(_NORM_DELETE)
+
+
+def _scandir_list(path):
+    """All directory entries of *path*, or an empty list if unreadable"""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+# Static file bodies written during per-game installs, built once at import
+# instead of re-assembled on every call
+_DEFAULT_INI_BYTES = b"""[GENERAL]
+EffectSearchPaths=.\\ReShade_shaders
+TextureSearchPaths=.\\ReShade_shaders
+PresetPath=.
+PerformanceMode=0
+PreprocessorDefinitions=
+Effects=
+Techniques=
+
+[INPUT]
+KeyOverlay=36
+KeyNextPreset=0
+KeyPreviousPreset=0
+"""
+
+_PRESET_TEMPLATE = """# ReShade Preset Configuration for {game_name}
+# This file will be automatically populated when you save presets in ReShade
+# Press HOME key in-game to open ReShade overlay
+# Go to Settings -> General -> "Reload all shaders" if shaders don't appear
+
+# Example preset configuration:
+# [Preset1]
+# Techniques=SMAA,Clarity,LumaSharpen
+# PreprocessorDefinitions=
+
+# Uncomment and modify the lines below to create a default preset:
+# [Default]
+# Techniques=
+# PreprocessorDefinitions=
+"""
+
+_README_TEMPLATE = """ReShade for {game_name}
+------------------------------------
+Installed with LetMeReShade plugin for Heroic Games Launcher
+
+DLL Override: {dll_override}
+Architecture: {arch}-bit
+Executable Directory: {exe_dir}
+{exe_line}
+
+Press HOME key in-game to open the ReShade overlay.
+
+If shaders are not visible:
+1. Open the ReShade overlay with HOME key
+2. Go to Settings tab
+3. Check paths for "Effect Search Paths" and "Texture Search Paths"
+4. They should point to the ReShade_shaders folder in this game directory
+5. If not, update them to: ".\\ReShade_shaders"
+
+Shader preset files (.ini) will be saved in this game directory.
+
+Files created:
+- ReShade.ini: Main ReShade configuration
+- ReShadePreset.ini: Preset configurations (auto-populated when you save presets)
+- {dll_override}.dll: ReShade DLL
+- d3dcompiler_47.dll: DirectX shader compiler
+- ReShade_shaders/: Shader files directory
+{autohdr_status}
+
+AutoHDR Compatibility:
+- Compatible APIs: DXGI, D3D11, D3D12 (DirectX 10/11/12)
+- Incompatible APIs: D3D9, D3D8, OpenGL32, DDraw, DInput8
+- Current API: {dll_override} {compat_marker}
+
+Note: If ReShadePreset.ini already existed, your previous settings were preserved.
+"""
+
+
+def _iter_exe_entries(root):
+    """Yield the DirEntry of every .exe under *root*, pruning runtime dirs
+
+    One scandir pass per directory; callers read the size from the cached
+    DirEntry stat so no file is stat'ed twice.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower() not in _SKIP_DIR_NAMES:
+                                stack.append(entry.path)
+                        elif entry.name.lower().endswith('.exe') and entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _tree_fingerprint(root):
+    """Digest of every file's (relpath, size, mtime) under *root*
+
+    Stat-only, so comparing fingerprints costs one directory walk instead of
+    re-copying thousands of shader files whose bytes have not changed.
+    """
+    entries = []
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        entries.append((os.path.relpath(entry.path, root), st.st_size, st.st_mtime_ns))
+        except OSError:
+            continue
+    entries.sort()
+    return hashlib.sha256(repr(entries).encode()).hexdigest()
+
+
+def _detect_pe_arch(path):
+    """Architecture of a PE executable ('32' or '64'), or None if unreadable
+
+    Reads the machine word straight out of the PE header instead of forking
+    file(1): e_lfanew at 0x3C points at "PE\0\0" followed by the machine id.
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(0x40)
+            if len(head) < 0x40 or head[:2] != b'MZ':
+                return None
+            e_lfanew = struct.unpack_from('<I', head, 0x3C)[0]
+            f.seek(e_lfanew)
+            sig = f.read(6)
+    except OSError:
+        return None
+    if len(sig) < 6 or sig[:4] != b'PE\x00\x00':
+        return None
+    machine = struct.unpack_from('<H', sig, 4)[0]
+    if machine in (0x8664, 0xAA64):  # x86-64 / ARM64
+        return '64'
+    if machine in (0x014C, 0x01C4):  # i386 / ARMNT
+        return '32'
+    return None
+
+
+def _pe_imported_dlls(path):
+    """Lowercased names of the DLLs a PE executable imports, as a set
+
+    Walks the import directory by hand over an mmap - DOS header to
+    e_lfanew, COFF header, optional-header data directory 1, section table
+    for RVA translation, then the IMAGE_IMPORT_DESCRIPTOR array. Touches a
+    few KiB of the file where objdump -p reads and formats all of it.
+    Returns an empty set for anything it cannot parse (packed or truncated
+    binaries included); callers treat that the same as "no known imports".
+    """
+    try:
+        with open(path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:2] != b'MZ':
+                return set()
+            pe_off = struct.unpack_from('<I', mm, 0x3C)[0]
+            if mm[pe_off:pe_off + 4] != b'PE\x00\x00':
+                return set()
+            num_sections, = struct.unpack_from('<H', mm, pe_off + 6)
+            opt_size, = struct.unpack_from('<H', mm, pe_off + 20)
+            opt_off = pe_off + 24
+            magic, = struct.unpack_from('<H', mm, opt_off)
+            # Data directories start at 96 (PE32) or 112 (PE32+) into the
+            # optional header; entry 1 is the import table
+            dd_off = opt_off + (96 if magic == 0x10B else 112)
+            import_rva, = struct.unpack_from('<I', mm, dd_off + 8)
+            if not import_rva:
+                return set()
+
+            # Section table: (VirtualAddress, raw size, PointerToRawData)
+            sections = []
+            sec_off = opt_off + opt_size
+            for i in range(num_sections):
+                off = sec_off + i * 40
+                vsize, vaddr, rsize, raw = struct.unpack_from('<IIII', mm, off + 8)
+                sections.append((vaddr, max(vsize, rsize), raw))
+
+            def rva_to_off(rva):
+                for vaddr, size, raw in sections:
+                    if vaddr <= rva < vaddr + size:
+                        return raw + (rva - vaddr)
+                return None
+
+            dlls = set()
+            desc_off = rva_to_off(import_rva)
+            if desc_off is None:
+                return dlls
+            # IMAGE_IMPORT_DESCRIPTOR is 20 bytes; the array ends at an
+            # all-zero entry. Name sits at offset 12 as an RVA to a C string.
+            while desc_off + 20 <= len(mm):
+                name_rva, = struct.unpack_from('<I', mm, desc_off + 12)
+                if not name_rva:
+                    break
+                name_off = rva_to_off(name_rva)
+                if name_off is not None:
+                    end = mm.find(b'\x00', name_off, name_off + 256)
+                    if end > name_off:
+                        dlls.add(mm[name_off:end].decode('ascii', 'ignore').lower())
+                desc_off += 20
+            return dlls
+    except (OSError, ValueError, struct.error):
+        return set()
+
+
+def _link_or_copy(src, dst):
+    """Hardlink *src* to *dst*, copying only when the link is impossible
+
+    The ReShade data dir and the game prefixes both live under $HOME, so a
+    linkat usually replaces a multi-megabyte read/write cycle outright. A
+    stale destination is removed first because os.link refuses to overwrite.
+    """
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _open_noatime(path):
+    """Open a file read-only without updating its atime, when permitted
+
+    O_NOATIME fails with EPERM on files we don't own, in which case we fall
+    back to a plain read-only open.
+    """
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        fd = os.open(path, os.O_RDONLY)
+    return os.fdopen(fd, "rb")
 
 class Plugin:
     def __init__(self):
         self.environment = {
-            'XDG_DATA_HOME': os.path.expandvars('$HOME/.local/share'),
+            'XDG_DATA_HOME': _XDG_DATA_HOME,
             'UPDATE_RESHADE': '1',
             'MERGE_SHADERS': '1',
             'VULKAN_SUPPORT': '0',
@@ -23,41 +397,101 @@ class Plugin:
             'AUTOHDR_ENABLED': '0'
         }
         # Main paths for ReShade
-        self.main_path = os.path.join(self.environment['XDG_DATA_HOME'], 'reshade')
+        self.main_path = _RESHADE_PATH
         
         # Cache for executable paths
         self.executable_cache = {}
+
+        # Cached Steam library index ({appid: manifest info}), keyed on the
+        # libraryfolders.vdf mtime so we only re-scan manifests when the
+        # library actually changes
+        self._manifest_cache = None
+        self._library_paths = []
+        self._appid_to_library = {}
+        self._libvdf_stat = (0, 0)
+        self._libvdf_path = f"{decky.HOME}/.steam/steam/steamapps/libraryfolders.vdf"
+        # Per-manifest parse results keyed by path, so an index rebuild only
+        # re-reads manifests whose mtime actually changed
+        self._manifest_parse_cache = {}
+
+        # Persistent games list served to the UI before any filesystem scan
+        self._games_cache_file = os.path.join(self.main_path, "games_cache.json")
+
+        # Shared worker pool for I/O-bound work like manifest parsing
+        self._io_pool = ThreadPoolExecutor(max_workers=8)
+
+        # Memoized check_reshade_path result; install/uninstall invalidate
+        # it explicitly and a short TTL catches out-of-band marker changes,
+        # so the UI poll costs no syscalls in between
+        self._reshade_status = None
+        self._reshade_status_time = 0.0
+        self._marker_dir_mtime = None
+
+        # Resolved executable directories keyed on (base_path, mtime_ns);
+        # valid until the game directory itself changes
+        self._best_exe_cache = {}
+
+        # Parsed GamesConfig JSONs keyed on path, guarded by file mtime
+        self._cfg_cache = {}
+
+        # Merged environment for the bundled scripts, built once; the empty
+        # LD_LIBRARY_PATH is the required fix for Decky v3.1.10+
+        self._script_env = {**os.environ, **self.environment, "LD_LIBRARY_PATH": ""}
+        # Plain process env with the same LD_LIBRARY_PATH fix, for external
+        # tools like objdump; built once instead of copying os.environ per call
+        self._tool_env = {**os.environ, "LD_LIBRARY_PATH": ""}
+
+        # Resolved assets directory, memoized on first successful lookup
+        self._assets_dir = None
+
+        # Installation marker paths, used on every frontend poll
+        self._marker_file = os.path.join(self.main_path, ".installed")
+        self._addon_marker_file = os.path.join(self.main_path, ".installed_addon")
         
         # Create necessary directories
         os.makedirs(self.main_path, exist_ok=True)
 
     def _get_assets_dir(self) -> Path:
         """Get the assets directory, checking both possible locations"""
+        if self._assets_dir is not None:
+            return self._assets_dir
+
         plugin_dir = Path(decky.DECKY_PLUGIN_DIR)
         
         # Check defaults/assets first (development)
         defaults_assets = plugin_dir / "defaults" / "assets"
         if defaults_assets.exists():
             decky.logger.info(f"Using assets from: {defaults_assets}")
+            self._assets_dir = defaults_assets
             return defaults_assets
             
         # Check assets (decky store installation)
         assets = plugin_dir / "assets"
         if assets.exists():
             decky.logger.info(f"Using assets from: {assets}")
+            self._assets_dir = assets
             return assets
             
         # Fallback to defaults/assets even if it doesn't exist (for error reporting)
+        # without caching, so a late install is still picked up
         decky.logger.warning(f"Neither {defaults_assets} nor {assets} exists, defaulting to {defaults_assets}")
         return defaults_assets
 
     async def _main(self):
         assets_dir = self._get_assets_dir()
-        for script in assets_dir.glob("*.sh"):
-            script.chmod(0o755)
+        # Only chmod scripts that aren't executable yet; on repeat plugin
+        # loads this costs nothing beyond the directory read
+        with os.scandir(assets_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".sh"):
+                    continue
+                mode = entry.stat().st_mode
+                if (mode & 0o111) != 0o111:
+                    os.chmod(entry.path, mode | 0o755)
         decky.logger.info("ReShade plugin loaded")
 
     async def _unload(self):
+        self._io_pool.shutdown(wait=False)
         decky.logger.info("ReShade plugin unloaded")
 
     async def parse_steam_logs_for_executable(self, appid: str) -> dict:
@@ -91,11 +525,17 @@ class Plugin:
                 decky.logger.info(f"Checking log file: {log_file}")
                 
                 try:
-                    # Read the log file (check last 10000 lines for performance)
-                    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        # Check recent lines first (Steam logs can be large)
-                        recent_lines = lines[-10000:] if len(lines) > 10000 else lines
+                    # Read only the tail of the log (Steam logs grow into the
+                    # tens of MB); one bulk read + splitlines instead of
+                    # readlines() materializing every line of the whole file
+                    TAIL_BYTES = 2 * 1024 * 1024
+                    with _open_noatime(log_file) as f:
+                        size = os.fstat(f.fileno()).st_size
+                        if size > TAIL_BYTES:
+                            f.seek(size - TAIL_BYTES)
+                            f.readline()  # drop the partial first line
+                        data = f.read()
+                    recent_lines = data.decode('utf-8', errors='ignore').splitlines()
                         
                     # Look for game launch patterns
                     for line in recent_lines:
@@ -103,7 +543,7 @@ class Plugin:
                         # Example: AppId=501300 -- ... '/path/to/game.exe'
                         if f"AppId={appid}" in line and ".exe" in line:
                             # Extract the executable path
-                            exe_match = re.search(r"'([^']*\.exe)'", line)
+                            exe_match = _LOG_EXE_SQ_RE.search(line)
                             if exe_match:
                                 potential_exe = exe_match.group(1)
                                 # Verify this is a real path and not a temp file
@@ -116,10 +556,10 @@ class Plugin:
                         # Pattern 2: Game process added/updated logs
                         # Example: Game process added : AppID 501300 "command with exe path"
                         if f"AppID {appid}" in line and (".exe" in line or "Game process" in line):
-                            exe_match = re.search(r"'([^']*\.exe)'", line)
+                            exe_match = _LOG_EXE_SQ_RE.search(line)
                             if not exe_match:
                                 # Try different quote patterns
-                                exe_match = re.search(r'"([^"]*\.exe)"', line)
+                                exe_match = _LOG_EXE_DQ_RE.search(line)
                             if exe_match:
                                 potential_exe = exe_match.group(1)
                                 if "/steamapps/common/" in potential_exe and os.path.exists(potential_exe):
@@ -170,57 +610,35 @@ class Plugin:
         try:
             decky.logger.info(f"Enhanced detection with simplified Linux check for App ID: {appid}")
             
-            # Get the base game path using existing method
+            # Get the base game path from the shared Steam index
             try:
-                steam_root = Path(decky.HOME) / ".steam" / "steam"
-                library_file = steam_root / "steamapps" / "libraryfolders.vdf"
-
-                if not library_file.exists():
+                try:
+                    index = await asyncio.to_thread(self._load_steam_index)
+                except ValueError:
                     return {"status": "error", "message": "Steam library file not found"}
 
-                library_paths = []
-                with open(library_file, "r", encoding="utf-8") as file:
-                    for line in file:
-                        if '"path"' in line:
-                            path = line.split('"path"')[1].strip().strip('"').replace("\\\\", "/")
-                            library_paths.append(path)
+                game_info = index.get(appid)
+                if not game_info or not game_info["installdir"]:
+                    return {"status": "error", "message": f"Could not find installation directory for AppID: {appid}"}
 
-                base_game_path = None
-                game_name = None
-                for library_path in library_paths:
-                    manifest_path = Path(library_path) / "steamapps" / f"appmanifest_{appid}.acf"
-                    if manifest_path.exists():
-                        with open(manifest_path, "r", encoding="utf-8") as manifest:
-                            manifest_content = manifest.read()
-                            for line in manifest_content.split('\n'):
-                                if '"installdir"' in line:
-                                    install_dir = line.split('"installdir"')[1].strip().strip('"')
-                                    base_game_path = str(Path(library_path) / "steamapps" / "common" / install_dir)
-                                    game_name = install_dir
-                                elif '"name"' in line:
-                                    game_title = line.split('"name"')[1].strip().strip('"')
-                                    if not game_name:
-                                        game_name = game_title
-                        break
+                install_dir = game_info["installdir"]
+                base_game_path = str(Path(game_info["library"]) / "steamapps" / "common" / install_dir)
+                game_name = install_dir
 
-                if not base_game_path:
-                    return {"status": "error", "message": f"Could not find installation directory for AppID: {appid}"}
-                    
                 decky.logger.info(f"Base game path: {base_game_path}")
                 decky.logger.info(f"Game name from Steam: {game_name}")
-                
+
                 # Check appmanifest for Linux indicators
                 manifest_has_linux = False
-                for library_path in library_paths:
-                    manifest_path = Path(library_path) / "steamapps" / f"appmanifest_{appid}.acf"
-                    if manifest_path.exists():
-                        with open(manifest_path, "r", encoding="utf-8") as manifest:
-                            manifest_content = manifest.read().lower()
-                            if "linux" in manifest_content:
-                                manifest_has_linux = True
-                                decky.logger.info("Found 'linux' in appmanifest")
-                                break
-                
+                manifest_path = f"{game_info['library']}/steamapps/appmanifest_{appid}.acf"
+                try:
+                    with open(manifest_path, "r", encoding="utf-8") as manifest:
+                        if "linux" in manifest.read().lower():
+                            manifest_has_linux = True
+                            decky.logger.info("Found 'linux' in appmanifest")
+                except OSError as e:
+                    decky.logger.warning(f"Could not read manifest for Linux check: {e}")
+
             except Exception as e:
                 return {"status": "error", "message": str(e)}
             
@@ -238,50 +656,67 @@ class Plugin:
             
             decky.logger.info(f"Scanning directory tree for executables and Linux indicators: {base_game_path}")
             
-            # Single directory traversal
-            for root, dirs, files in os.walk(base_game_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_obj = Path(file_path)
-                    rel_path = os.path.relpath(file_path, base_game_path)
-                    
-                    try:
-                        file_size = os.path.getsize(file_path)
-                    except:
-                        continue
-                    
-                    # Check for Windows executables
-                    if file.lower().endswith('.exe'):
-                        all_executables.append({
-                            "path": file_path,
-                            "directory_path": os.path.dirname(file_path),
-                            "relative_path": rel_path,
-                            "filename": file,
-                            "size": file_size,
-                            "size_mb": round(file_size / (1024 * 1024), 1),
-                            "type": "windows_exe"
-                        })
-                        decky.logger.debug(f"Found Windows exe: {file} ({rel_path}) - {round(file_size / (1024 * 1024), 1)}MB")
-                    
-                    # Simplified Linux detection - only .so and .sh files
-                    file_lower = file.lower()
-                    
-                    # Check for .so files
-                    if file_lower.endswith('.so') or '.so.' in file_lower:
-                        linux_indicators['so_files'].append(rel_path)
-                        decky.logger.debug(f"Found .so file: {rel_path}")
-                    
-                    # Check for .sh files
-                    elif file_lower.endswith('.sh'):
-                        linux_indicators['sh_files'].append(rel_path)
-                        decky.logger.debug(f"Found .sh file: {rel_path}")
+            # Single directory traversal; scandir keeps type/size info from
+            # the directory read so only .exe files cost a stat at all
+            dir_stack = [base_game_path]
+            while dir_stack:
+                current_dir = dir_stack.pop()
+                try:
+                    entries = os.scandir(current_dir)
+                except OSError:
+                    continue
+
+                with entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name.lower() not in _SKIP_DIR_NAMES:
+                                    dir_stack.append(entry.path)
+                                continue
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                        except OSError:
+                            continue
+
+                        file = entry.name
+                        file_lower = file.lower()
+
+                        # Check for Windows executables
+                        if file_lower.endswith('.exe'):
+                            try:
+                                file_size = entry.stat().st_size
+                            except OSError:
+                                continue
+                            file_path = entry.path
+                            rel_path = os.path.relpath(file_path, base_game_path)
+                            all_executables.append({
+                                "path": file_path,
+                                "directory_path": current_dir,
+                                "relative_path": rel_path,
+                                "filename": file,
+                                "size": file_size,
+                                "size_mb": round(file_size / (1024 * 1024), 1),
+                                "type": "windows_exe"
+                            })
+                            decky.logger.debug(f"Found Windows exe: {file} ({rel_path}) - {round(file_size / (1024 * 1024), 1)}MB")
+
+                        # Simplified Linux detection - only .so and .sh files
+                        elif file_lower.endswith('.so') or '.so.' in file_lower:
+                            rel_path = os.path.relpath(entry.path, base_game_path)
+                            linux_indicators['so_files'].append(rel_path)
+                            decky.logger.debug(f"Found .so file: {rel_path}")
+
+                        elif file_lower.endswith('.sh'):
+                            rel_path = os.path.relpath(entry.path, base_game_path)
+                            linux_indicators['sh_files'].append(rel_path)
+                            decky.logger.debug(f"Found .sh file: {rel_path}")
             
             # Filter out utility executables from Windows list
             main_windows_executables = []
             for exe in all_executables:
                 if exe["type"] == "windows_exe":
                     exe_name = exe["filename"].lower()
-                    if not any(skip in exe_name for skip in ["unins", "redist", "vcredist", "directx", "setup", "install"]):
+                    if not _SKIP_INSTALLER_RE.search(exe_name):
                         main_windows_executables.append(exe)
             
             # Simplified Linux game determination
@@ -383,12 +818,12 @@ class Plugin:
                 decky.logger.debug(f"Scoring {filename} at {rel_path}")
                 
                 # Enhanced game name matching with multiple normalization approaches
-                clean_game_name = re.sub(r'[^a-z0-9]', '', game_name.lower()) if game_name else ""
-                clean_filename = re.sub(r'[^a-z0-9]', '', filename_no_ext)
+                clean_game_name = _NON_ALNUM_RE.sub('', game_name.lower()) if game_name else ""
+                clean_filename = _NON_ALNUM_RE.sub('', filename_no_ext)
                 
                 # Split into words for more flexible matching
-                game_name_words = re.findall(r'[a-z0-9]+', game_name.lower()) if game_name else []
-                filename_words = re.findall(r'[a-z0-9]+', filename_no_ext)
+                game_name_words = _ALNUM_RUN_RE.findall(game_name.lower()) if game_name else []
+                filename_words = _ALNUM_RUN_RE.findall(filename_no_ext)
                 
                 # Calculate various types of matches
                 name_match_score = 0
@@ -423,7 +858,7 @@ class Plugin:
                         decky.logger.debug(f"  Word match: +{min(40, round(word_score))} ({matching_words})")
                 
                 # Common game executable names bonus
-                if any(common in filename_no_ext.lower() for common in ["game", "main", "client", "app", "play"]):
+                if _COMMON_EXE_RE.search(filename_no_ext.lower()):
                     common_bonus = 15
                     name_match_score += common_bonus
                     decky.logger.debug(f"  Common game exe name: +{common_bonus}")
@@ -623,26 +1058,24 @@ class Plugin:
             all_executables = []
             
             decky.logger.info(f"Walking directory tree starting from: {game_path}")
-            for root, dirs, files in os.walk(game_path):
-                for file in files:
-                    if file.lower().endswith('.exe'):
-                        exe_path = os.path.join(root, file)
-                        try:
-                            file_size = os.path.getsize(exe_path)
-                            rel_path = os.path.relpath(exe_path, game_path)
-                            
-                            all_executables.append({
-                                "path": exe_path,
-                                "directory_path": os.path.dirname(exe_path),
-                                "relative_path": rel_path,
-                                "filename": file,
-                                "size": file_size,
-                                "size_mb": round(file_size / (1024 * 1024), 1)
-                            })
-                            decky.logger.debug(f"Found exe: {file} ({rel_path}) - {round(file_size / (1024 * 1024), 1)}MB")
-                        except Exception as e:
-                            decky.logger.warning(f"Error getting size for {exe_path}: {str(e)}")
-                            continue
+            for entry in _iter_exe_entries(game_path):
+                exe_path = entry.path
+                try:
+                    file_size = entry.stat().st_size
+                    rel_path = os.path.relpath(exe_path, game_path)
+                    
+                    all_executables.append({
+                        "path": exe_path,
+                        "directory_path": os.path.dirname(exe_path),
+                        "relative_path": rel_path,
+                        "filename": entry.name,
+                        "size": file_size,
+                        "size_mb": round(file_size / (1024 * 1024), 1)
+                    })
+                    decky.logger.debug(f"Found exe: {entry.name} ({rel_path}) - {round(file_size / (1024 * 1024), 1)}MB")
+                except Exception as e:
+                    decky.logger.warning(f"Error getting size for {exe_path}: {str(e)}")
+                    continue
             
             if not all_executables:
                 return {
@@ -664,8 +1097,7 @@ class Plugin:
                 decky.logger.debug(f"Scoring {filename} at {rel_path}")
                 
                 # LESS aggressive utility filtering - only skip very obvious ones
-                utility_keywords = ["unins", "setup", "vcredist", "directx", "redist"]
-                if any(skip in filename for skip in utility_keywords):
+                if _SKIP_OBVIOUS_RE.search(filename):
                     decky.logger.debug(f"  Utility file detected: {filename}")
                     return 0
                 
@@ -675,14 +1107,14 @@ class Plugin:
                 clean_game_name = game_name.lower()
                 
                 # 2. Clean up names by removing spaces, special chars, etc.
-                clean_dir_name = re.sub(r'[^a-z0-9]', '', dir_name)
-                norm_game_name = re.sub(r'[^a-z0-9]', '', clean_game_name)
-                norm_filename = re.sub(r'[^a-z0-9]', '', filename_no_ext)
+                clean_dir_name = _NON_ALNUM_RE.sub('', dir_name)
+                norm_game_name = _NON_ALNUM_RE.sub('', clean_game_name)
+                norm_filename = _NON_ALNUM_RE.sub('', filename_no_ext)
                 
                 # 3. Split into words for more flexible matching
-                dir_words = re.findall(r'[a-z0-9]+', dir_name)
-                game_name_words = re.findall(r'[a-z0-9]+', clean_game_name)
-                filename_words = re.findall(r'[a-z0-9]+', filename_no_ext)
+                dir_words = _ALNUM_RUN_RE.findall(dir_name)
+                game_name_words = _ALNUM_RUN_RE.findall(clean_game_name)
+                filename_words = _ALNUM_RUN_RE.findall(filename_no_ext)
                 
                 # Log the normalized values for debugging
                 decky.logger.debug(f"  Normalized names - Dir: '{clean_dir_name}', Game: '{norm_game_name}', File: '{norm_filename}'")
@@ -741,7 +1173,7 @@ class Plugin:
                         decky.logger.debug(f"  Word match: +{min(40, round(word_score))} ({best_matches})")
                 
                 # Common game executable names bonus
-                if any(common in filename_no_ext.lower() for common in ["game", "main", "client", "app", "play"]):
+                if _COMMON_EXE_RE.search(filename_no_ext.lower()):
                     common_bonus = 15
                     name_match_score += common_bonus
                     decky.logger.debug(f"  Common game exe name: +{common_bonus}")
@@ -1307,16 +1739,31 @@ class Plugin:
             }
 
     async def check_reshade_path(self) -> dict:
-        path = Path(os.path.expanduser("~/.local/share/reshade"))
-        marker_file = path / ".installed"
-        addon_marker = path / ".installed_addon"
-        
+        now = time.monotonic()
+        if self._reshade_status is not None and now - self._reshade_status_time <= 1.0:
+            return self._reshade_status
+
+        # Past the TTL, one stat of the marker directory decides whether the
+        # cached answer still holds: creating or removing a marker bumps the
+        # parent mtime, so an unchanged mtime means nothing to re-probe
+        if self._reshade_status is not None:
+            try:
+                dir_mtime = os.stat(self.main_path).st_mtime_ns
+            except OSError:
+                dir_mtime = None
+            if dir_mtime is not None and dir_mtime == self._marker_dir_mtime:
+                self._reshade_status_time = now
+                return self._reshade_status
+
+        is_addon = os.path.exists(self._addon_marker_file)
+        exists = is_addon or os.path.exists(self._marker_file)
+
         # Check version information
         version_info = {"version": "unknown", "addon": False}
-        if marker_file.exists() or addon_marker.exists():
+        if exists:
             try:
-                version_file = path / "reshade" / "LVERS"
-                if version_file.exists():
+                version_file = f"{_RESHADE_PATH}/reshade/LVERS"
+                if os.path.exists(version_file):
                     with open(version_file, 'r') as f:
                         version_content = f.read().strip()
                         if "last" in version_content.lower():
@@ -1326,12 +1773,18 @@ class Plugin:
                         version_info["addon"] = "addon" in version_content.lower()
             except Exception as e:
                 decky.logger.error(f"Error reading version info: {str(e)}")
-        
-        return {
-            "exists": marker_file.exists() or addon_marker.exists(),
-            "is_addon": addon_marker.exists(),
+
+        self._reshade_status = {
+            "exists": exists,
+            "is_addon": is_addon,
             "version_info": version_info
         }
+        self._reshade_status_time = now
+        try:
+            self._marker_dir_mtime = os.stat(self.main_path).st_mtime_ns
+        except OSError:
+            self._marker_dir_mtime = None
+        return self._reshade_status
 
     async def run_install_reshade(self, with_addon: bool = False, version: str = "latest", with_autohdr: bool = False, selected_shaders: list = None) -> dict:
         try:
@@ -1363,7 +1816,7 @@ class Plugin:
             # Add other necessary environment variables
             install_env.update({
                 'LD_LIBRARY_PATH': '/usr/lib',
-                'XDG_DATA_HOME': os.path.expandvars('$HOME/.local/share')
+                'XDG_DATA_HOME': _XDG_DATA_HOME
             })
 
             install_description = f"Installing ReShade {version}"
@@ -1377,47 +1830,58 @@ class Plugin:
             decky.logger.info(install_description)
             decky.logger.info(f"Environment: {install_env}")
 
-            # Create environment with required LD_LIBRARY_PATH fix for Decky v3.1.10+
-            clean_env = {**os.environ, **install_env}
-            clean_env["LD_LIBRARY_PATH"] = ""
+            # Layer the per-install knobs over the precomputed script env
+            clean_env = {**self._script_env, **install_env, "LD_LIBRARY_PATH": ""}
             
-            process = subprocess.run(
-                ["/bin/bash", str(script_path)],
+            process = await asyncio.create_subprocess_exec(
+                "/bin/bash", str(script_path),
                 cwd=str(assets_dir),
                 env=clean_env,
-                capture_output=True,
-                text=True,
-                timeout=300
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
             )
 
-            decky.logger.info(f"Install output:\n{process.stdout}")
-            if process.stderr:
-                decky.logger.error(f"Install errors:\n{process.stderr}")
+            # Stream the script output line by line so the log stays timely
+            # and memory stays bounded instead of buffering the whole run
+            output_tail = deque(maxlen=50)
 
-            if process.returncode != 0:
-                return {"status": "error", "message": process.stderr}
+            async def _stream_output():
+                async for raw_line in process.stdout:
+                    line = raw_line.decode("utf-8", errors="replace").rstrip()
+                    decky.logger.info(f"Install: {line}")
+                    output_tail.append(line)
+
+            try:
+                await asyncio.wait_for(_stream_output(), timeout=300)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return {"status": "error", "message": "Install script timed out"}
 
-            # Create appropriate installation marker
+            returncode = await process.wait()
+
+            if returncode != 0:
+                return {"status": "error", "message": "\n".join(output_tail)}
+
+            # Create appropriate installation marker, removing the other kind
             if with_addon:
-                marker_file = Path(self.main_path) / ".installed_addon"
-                # Remove non-addon marker if it exists
-                normal_marker = Path(self.main_path) / ".installed"
-                if normal_marker.exists():
-                    normal_marker.unlink()
+                marker_file = self._addon_marker_file
+                stale_marker = self._marker_file
             else:
-                marker_file = Path(self.main_path) / ".installed"
-                # Remove addon marker if it exists
-                addon_marker = Path(self.main_path) / ".installed_addon"
-                if addon_marker.exists():
-                    addon_marker.unlink()
+                marker_file = self._marker_file
+                stale_marker = self._addon_marker_file
 
-            marker_file.touch()
+            if os.path.exists(stale_marker):
+                os.remove(stale_marker)
+
+            open(marker_file, 'ab').close()
 
             # Save the installed configuration
             await self.save_installed_configuration(with_addon, version, with_autohdr, selected_shaders)
 
-            # Clear executable cache since new installation might affect detection
+            # Clear caches since the new installation changes detection state
             self.executable_cache.clear()
+            self._reshade_status = None
 
             # Create success message
             version_display = f"ReShade {version.title()}"
@@ -1441,32 +1905,27 @@ class Plugin:
             if not script_path.exists():
                 return {"status": "error", "message": "Uninstall script not found"}
 
-            # Create environment with required LD_LIBRARY_PATH fix for Decky v3.1.10+
-            clean_env = {**os.environ, **self.environment}
-            clean_env["LD_LIBRARY_PATH"] = ""
-            
-            process = subprocess.run(
-                ["/bin/bash", str(script_path)],
+            process = await asyncio.create_subprocess_exec(
+                "/bin/bash", str(script_path),
                 cwd=str(assets_dir),
-                env=clean_env,
-                capture_output=True,
-                text=True
+                env=self._script_env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-            
+            stdout, stderr = await process.communicate()
+
             if process.returncode != 0:
-                return {"status": "error", "message": process.stderr}
+                return {"status": "error", "message": stderr.decode("utf-8", errors="replace")}
 
             # Remove installation markers
-            marker_file = Path(self.main_path) / ".installed"
-            addon_marker = Path(self.main_path) / ".installed_addon"
-            if marker_file.exists():
-                marker_file.unlink()
-            if addon_marker.exists():
-                addon_marker.unlink()
-
-            # Clear installed configuration and cache
+            for marker in (self._marker_file, self._addon_marker_file):
+                if os.path.exists(marker):
+                    os.remove(marker)
+
+            # Clear installed configuration and caches
             await self.clear_installed_configuration()
             self.executable_cache.clear()
+            self._reshade_status = None
                 
             return {"status": "success", "output": "ReShade uninstalled"}
         except Exception as e:
@@ -1489,7 +1948,7 @@ class Plugin:
                     decky.logger.info(f"Installing ReShade to directory: {game_path}")
                 elif action == "install":
                     # Get the base game installation path (not executable-specific directory)
-                    game_path = self._find_game_path(appid)
+                    game_path = await self._find_game_path(appid)
                     decky.logger.info(f"Using base game path for Bash detection: {game_path}")
                 else:
                     # For uninstall, we still need to find where ReShade was installed
@@ -1505,10 +1964,10 @@ class Plugin:
                             game_path = os.path.dirname(exe_result["enhanced_detection_result"]["executable_path"])
                             decky.logger.info(f"Using enhanced detection directory for uninstall: {game_path}")
                         else:
-                            game_path = self._find_game_path(appid)
+                            game_path = await self._find_game_path(appid)
                             decky.logger.info(f"Using base game path for uninstall: {game_path}")
                     except:
-                        game_path = self._find_game_path(appid)
+                        game_path = await self._find_game_path(appid)
                         decky.logger.info(f"Using base game path for uninstall (fallback): {game_path}")
                 
                 decky.logger.info(f"Final game path: {game_path}")
@@ -1518,7 +1977,7 @@ class Plugin:
             # Build command - if user selected a specific path, don't pass appid to prevent bash script from overriding
             cmd = ["/bin/bash", str(script_path), action, game_path, dll_override]
             if vulkan_mode:
-                cmd.extend([vulkan_mode, os.path.expanduser(f"~/.local/share/Steam/steamapps/compatdata/{appid}"), appid])
+                cmd.extend([vulkan_mode, f"{_XDG_DATA_HOME}/Steam/steamapps/compatdata/{appid}", appid])
             else:
                 # For non-Vulkan mode, add empty placeholders for vulkan_mode and wineprefix
                 if using_user_selected_path:
@@ -1531,75 +1990,86 @@ class Plugin:
             
             decky.logger.info(f"Executing command: {' '.join(cmd)}")
             
-            # Create environment with required LD_LIBRARY_PATH fix for Decky v3.1.10+
-            clean_env = {**os.environ, **self.environment}
-            clean_env["LD_LIBRARY_PATH"] = ""
-            
-            process = subprocess.run(
-                cmd,
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
                 cwd=str(assets_dir),
-                env=clean_env,
-                capture_output=True,
-                text=True
+                env=self._script_env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-            
-            decky.logger.info(f"Script output: {process.stdout}")
-            if process.stderr:
-                decky.logger.error(f"Script errors: {process.stderr}")
+            stdout_data, stderr_data = await process.communicate()
+            stdout = stdout_data.decode("utf-8", errors="replace")
+            stderr = stderr_data.decode("utf-8", errors="replace")
+
+            decky.logger.info(f"Script output: {stdout}")
+            if stderr:
+                decky.logger.error(f"Script errors: {stderr}")
             
             if process.returncode != 0:
-                return {"status": "error", "message": process.stderr}
+                return {"status": "error", "message": stderr}
                 
-            return {"status": "success", "output": process.stdout}
+            return {"status": "success", "output": stdout}
         except Exception as e:
             decky.logger.error(str(e))
             return {"status": "error", "message": str(e)}
 
+    def _libvdf_disk_stat(self) -> list:
+        st = os.stat(self._libvdf_path)
+        return [st.st_mtime_ns, st.st_size]
+
+    def _load_games_cache(self):
+        """Return the persisted games list if it still matches the library state"""
+        try:
+            vdf_stat = self._libvdf_disk_stat()
+            with open(self._games_cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("libvdf_stat") == vdf_stat:
+                return cache.get("games")
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_games_cache(self, games: list) -> None:
+        """Persist the games list atomically next to the other plugin state"""
+        try:
+            cache = {"libvdf_stat": self._libvdf_disk_stat(), "games": games}
+            tmp_file = f"{self._games_cache_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, self._games_cache_file)
+        except OSError as e:
+            decky.logger.warning(f"Could not write games cache: {e}")
+
+    def _filter_games(self, index: dict) -> list:
+        # Filter out system components and redistributables that shouldn't be modded with ReShade
+        return [{"appid": appid, "name": info["name"]}
+                for appid, info in index.items()
+                if info["name"] and not any(part in info["name"] for part in _EXCLUDED_NAME_PARTS)]
+
+    async def _refresh_games_cache(self) -> None:
+        try:
+            index = await asyncio.to_thread(self._load_steam_index)
+            self._write_games_cache(self._filter_games(index))
+        except Exception as e:
+            decky.logger.warning(f"Background games-cache refresh failed: {e}")
+
     async def list_installed_games(self) -> dict:
         try:
-            steam_root = Path(decky.HOME) / ".steam" / "steam"
-            library_file = steam_root / "steamapps" / "libraryfolders.vdf"
+            # Serve the persisted list immediately when it's still valid and
+            # refresh it in the background, so the UI never waits on a scan
+            cached_games = await asyncio.to_thread(self._load_games_cache)
+            if cached_games is not None:
+                asyncio.create_task(self._refresh_games_cache())
+                return {"status": "success", "games": cached_games}
 
-            if not library_file.exists():
+            try:
+                index = await asyncio.to_thread(self._load_steam_index)
+            except ValueError:
                 return {"status": "error", "message": "libraryfolders.vdf not found"}
 
-            library_paths = []
-            with open(library_file, "r", encoding="utf-8") as file:
-                for line in file:
-                    if '"path"' in line:
-                        path = line.split('"path"')[1].strip().strip('"').replace("\\\\", "/")
-                        library_paths.append(path)
+            filtered_games = self._filter_games(index)
+            await asyncio.to_thread(self._write_games_cache, filtered_games)
 
-            games = []
-            for library_path in library_paths:
-                steamapps_path = Path(library_path) / "steamapps"
-                if not steamapps_path.exists():
-                    continue
-
-                for appmanifest in steamapps_path.glob("appmanifest_*.acf"):
-                    with open(appmanifest, "r", encoding="utf-8") as file:
-                        game_info = {"appid": None, "name": None}
-                        for line in file:
-                            if '"appid"' in line:
-                                game_info["appid"] = line.split('"appid"')[1].strip().strip('"')
-                            if '"name"' in line:
-                                game_info["name"] = line.split('"name"')[1].strip().strip('"')
-
-                        if game_info["appid"] and game_info["name"]:
-                            games.append(game_info)
-
-            # Filter out system components and redistributables that shouldn't be modded with ReShade
-            filtered_games = [g for g in games if not any(exclude in g["name"] for exclude in [
-                "Proton", 
-                "Steam Linux Runtime", 
-                "Steamworks Common Redistributables",
-                "DirectX",
-                "Visual C++",
-                "Microsoft Visual C++",
-                ".NET Framework",
-                "OpenXR"
-            ])]
-            
             return {"status": "success", "games": filtered_games}
 
         except Exception as e:
@@ -1610,18 +2080,18 @@ class Plugin:
         """Find games installed through Heroic Launcher using the config file"""
         try:
             # Read the Heroic config file to get the default install path
-            heroic_config_path = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/store/config.json")
+            heroic_config_path = f"{_HEROIC_CONFIG}/store/config.json"
             
             if not os.path.exists(heroic_config_path):
                 return {"status": "error", "message": "Heroic config file not found"}
                 
-            with open(heroic_config_path, 'r', encoding='utf-8') as f:
-                heroic_config = json.load(f)
+            with open(heroic_config_path, 'rb') as f:
+                heroic_config = _json_loads(f.read())
             
             # Get the install path from config
             default_install_path = heroic_config.get("settings", {}).get("defaultInstallPath")
             if not default_install_path:
-                default_install_path = os.path.expanduser("~/Games/Heroic")  # Fallback
+                default_install_path = f"{_HOME}/Games/Heroic"  # Fallback
             
             decky.logger.info(f"Heroic games install path: {default_install_path}")
             
@@ -1630,11 +2100,30 @@ class Plugin:
             recent_games_map = {game.get("title"): game.get("appName") for game in recent_games if game.get("title") and game.get("appName")}
             
             # Find all game directories in the install path
+            # Index GamesConfig once up front: every config JSON is parsed a
+            # single time and its top-level keys map back to the filename,
+            # instead of re-reading every config for every game
+            config_key_index = {}
+            games_config_dir = f"{_HEROIC_CONFIG}/GamesConfig"
+            for config_entry in _scandir_list(games_config_dir):
+                config_file = config_entry.name
+                if not config_file.endswith(".json"):
+                    continue
+                try:
+                    with open(config_entry.path, 'rb') as f:
+                        config_data = _json_loads(f.read())
+                    for key in config_data:
+                        config_key_index.setdefault(key, config_file)
+                except Exception as e:
+                    decky.logger.error(f"Error reading config file {config_file}: {str(e)}")
+
             games = []
-            if os.path.exists(default_install_path):
-                for game_dir in os.listdir(default_install_path):
-                    game_path = os.path.join(default_install_path, game_dir)
-                    if os.path.isdir(game_path) and game_dir.lower() not in ["prefixes", "temp", "legendary", "gog", "state", "logs"]:
+            install_entries = _scandir_list(default_install_path)
+            if install_entries:
+                for entry in install_entries:
+                    game_dir = entry.name
+                    game_path = entry.path
+                    if entry.is_dir(follow_symlinks=False) and game_dir.lower() not in _HEROIC_NON_GAME_DIRS:
                         # This is likely a game directory
                         game_info = {
                             "name": game_dir,
@@ -1652,37 +2141,32 @@ class Plugin:
                         ]
                         
                         for appinfo_path in appinfo_paths:
-                            if os.path.exists(appinfo_path):
-                                try:
-                                    with open(appinfo_path, 'r', encoding='utf-8') as f:
-                                        appinfo = json.load(f)
-                                        if "DisplayName" in appinfo:
-                                            game_info["name"] = appinfo["DisplayName"]
-                                        elif "AppName" in appinfo:
-                                            game_info["name"] = appinfo["AppName"]
-                                        if "AppId" in appinfo:
-                                            game_info["app_id"] = str(appinfo["AppId"])
-                                        break
-                                except Exception as e:
-                                    decky.logger.error(f"Error reading appinfo.json for {game_dir}: {str(e)}")
+                            # Open directly; a missing file costs one syscall
+                            # instead of an exists probe plus the open
+                            try:
+                                f = open(appinfo_path, 'rb')
+                            except FileNotFoundError:
+                                continue
+                            try:
+                                with f:
+                                    appinfo = _json_loads(f.read())
+                                if "DisplayName" in appinfo:
+                                    game_info["name"] = appinfo["DisplayName"]
+                                elif "AppName" in appinfo:
+                                    game_info["name"] = appinfo["AppName"]
+                                if "AppId" in appinfo:
+                                    game_info["app_id"] = str(appinfo["AppId"])
+                                break
+                            except Exception as e:
+                                decky.logger.error(f"Error reading appinfo.json for {game_dir}: {str(e)}")
                         
                         # Find and cache the config file information if available
                         if "app_id" in game_info:
                             # Check if there's a direct config file match
-                            games_config_dir = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/GamesConfig")
-                            for config_file in os.listdir(games_config_dir):
-                                if config_file.endswith(".json"):
-                                    config_file_path = os.path.join(games_config_dir, config_file)
-                                    try:
-                                        with open(config_file_path, 'r', encoding='utf-8') as f:
-                                            config_data = json.load(f)
-                                            # Check if app_id is a key in this config file
-                                            if game_info["app_id"] in config_data:
-                                                game_info["config_file"] = config_file
-                                                game_info["config_key"] = game_info["app_id"]
-                                                break
-                                    except Exception as e:
-                                        decky.logger.error(f"Error reading config file {config_file}: {str(e)}")
+                            config_file = config_key_index.get(game_info["app_id"])
+                            if config_file is not None:
+                                game_info["config_file"] = config_file
+                                game_info["config_key"] = game_info["app_id"]
                         
                         games.append(game_info)
             
@@ -1694,6 +2178,47 @@ class Plugin:
             decky.logger.error(f"Error finding Heroic games: {str(e)}")
             return {"status": "error", "message": str(e)}
 
+    @staticmethod
+    def _load_game_config(entry):
+        """Read and parse one GamesConfig file; (name, path, mtime, data) or None"""
+        try:
+            mtime_ns = entry.stat().st_mtime_ns
+            with open(entry.path, 'rb') as f:
+                return entry.name, entry.path, mtime_ns, _json_loads(f.read())
+        except Exception as e:
+            decky.logger.error(f"Error reading config file {entry.name}: {str(e)}")
+            return None
+
+    def _iter_game_configs(self):
+        """Yield (filename, parsed JSON) for every config in GamesConfig
+
+        Parses are cached per file on mtime, so the repeated passes within
+        one lookup - and any follow-up lookups - cost a stat per file.
+        Files missing from the cache are read through the I/O pool so a
+        cold scan overlaps its reads instead of paying the latency serially.
+        """
+        stale = []
+        for entry in _scandir_list(f"{_HEROIC_CONFIG}/GamesConfig"):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            cached = self._cfg_cache.get(entry.path)
+            if cached is not None and cached[0] == mtime_ns:
+                yield entry.name, cached[1]
+            else:
+                stale.append(entry)
+        if not stale:
+            return
+        for result in self._io_pool.map(self._load_game_config, stale):
+            if result is None:
+                continue
+            name, path, mtime_ns, config_data = result
+            self._cfg_cache[path] = (mtime_ns, config_data)
+            yield name, config_data
+
     async def find_heroic_game_config(self, game_path: str, game_name: str) -> dict:
         """
         Find the config file and key for a Heroic game using the config.json file
@@ -1702,18 +2227,34 @@ class Plugin:
             decky.logger.info(f"Finding config for Heroic game: {game_name} at {game_path}")
             
             # Normalize game name for more flexible matching
-            normalized_game_name = game_name.lower().replace(" ", "").replace("-", "").replace("_", "")
+            normalized_game_name = _normalize_string(game_name)
             normalized_game_path = os.path.normpath(game_path)
             base_folder_name = os.path.basename(normalized_game_path).lower()
             
             decky.logger.info(f"Normalized game name: {normalized_game_name}")
             decky.logger.info(f"Base folder name: {base_folder_name}")
             
+            # Fast path: Heroic records the exact install path for most games,
+            # so one pass over the configs usually resolves the lookup before
+            # any of the fuzzy matching phases run
+            for config_file, config_data in self._iter_game_configs():
+                for app_key, app_config in config_data.items():
+                    if not isinstance(app_config, dict):
+                        continue
+                    install_path = app_config.get("installPath", "")
+                    if install_path and os.path.normpath(install_path) == normalized_game_path:
+                        decky.logger.info(f"Exact installPath match: {config_file}, key: {app_key}")
+                        return {
+                            "status": "success",
+                            "config_file": config_file,
+                            "config_key": app_key
+                        }
+            
             # First, try to read the Heroic config file
-            heroic_config_path = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/store/config.json")
+            heroic_config_path = f"{_HEROIC_CONFIG}/store/config.json"
             if os.path.exists(heroic_config_path):
-                with open(heroic_config_path, 'r', encoding='utf-8') as f:
-                    heroic_config = json.load(f)
+                with open(heroic_config_path, 'rb') as f:
+                    heroic_config = _json_loads(f.read())
                 
                 # Get the list of recent games
                 recent_games = heroic_config.get("games", {}).get("recent", [])
@@ -1721,7 +2262,7 @@ class Plugin:
                 # Look for a match by title with flexible matching
                 for game in recent_games:
                     game_title = game.get("title", "")
-                    normalized_title = game_title.lower().replace(" ", "").replace("-", "").replace("_", "")
+                    normalized_title = _normalize_string(game_title)
                     
                     # Try multiple matching approaches
                     if (game.get("title") == game_name or  # Exact match
@@ -1736,83 +2277,62 @@ class Plugin:
                             decky.logger.info(f"Found appName in config.json for '{game_title}': {app_name}")
                             
                             # Now look for this appName in the GamesConfig directory
-                            games_config_dir = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/GamesConfig")
-                            for config_file in os.listdir(games_config_dir):
-                                if not config_file.endswith(".json"):
-                                    continue
-                                    
-                                config_file_path = os.path.join(games_config_dir, config_file)
-                                try:
-                                    with open(config_file_path, 'r', encoding='utf-8') as f:
-                                        config_data = json.load(f)
-                                        
-                                        if app_name in config_data:
-                                            decky.logger.info(f"Found config file: {config_file}, key: {app_name}")
-                                            return {
-                                                "status": "success",
-                                                "config_file": config_file,
-                                                "config_key": app_name
-                                            }
-                                except Exception as e:
-                                    decky.logger.error(f"Error reading config file {config_file}: {str(e)}")
+                            for config_file, config_data in self._iter_game_configs():
+                                if app_name in config_data:
+                                    decky.logger.info(f"Found config file: {config_file}, key: {app_name}")
+                                    return {
+                                        "status": "success",
+                                        "config_file": config_file,
+                                        "config_key": app_name
+                                    }
                 
                 # If direct matching failed, try checking winePrefix paths in all config files
                 decky.logger.info("Trying to match using winePrefix paths...")
-                games_config_dir = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/GamesConfig")
-                
-                for config_file in os.listdir(games_config_dir):
-                    if not config_file.endswith(".json"):
-                        continue
-                        
-                    config_file_path = os.path.join(games_config_dir, config_file)
-                    try:
-                        with open(config_file_path, 'r', encoding='utf-8') as f:
-                            config_data = json.load(f)
+                for config_file, config_data in self._iter_game_configs():
+                    # Check each game config
+                    for app_key, app_config in config_data.items():
+                        if not isinstance(app_config, dict):
+                            continue
+                        # Check winePrefix path
+                        wine_prefix = app_config.get("winePrefix", "")
+                        if wine_prefix:
+                            # Get both last part and parent part of path for more chances to match
+                            prefix_parts = wine_prefix.rstrip('/').split('/')
+                            last_part = prefix_parts[-1].lower()
+                            parent_part = prefix_parts[-2].lower() if len(prefix_parts) > 1 else ""
                             
-                            # Check each game config
-                            for app_key, app_config in config_data.items():
-                                # Check winePrefix path
-                                wine_prefix = app_config.get("winePrefix", "")
-                                if wine_prefix:
-                                    # Get both last part and parent part of path for more chances to match
-                                    prefix_parts = wine_prefix.rstrip('/').split('/')
-                                    last_part = prefix_parts[-1].lower()
-                                    parent_part = prefix_parts[-2].lower() if len(prefix_parts) > 1 else ""
-                                    
-                                    # Normalize for matching
-                                    last_part_norm = last_part.replace(" ", "").replace("-", "").replace("_", "")
-                                    parent_part_norm = parent_part.replace(" ", "").replace("-", "").replace("_", "")
-                                    
-                                    # Enhanced matching for Wine prefix components
-                                    if (last_part.lower() == game_name.lower() or
-                                        last_part_norm == normalized_game_name or
-                                        normalized_game_name in last_part_norm or
-                                        last_part_norm in normalized_game_name or
-                                        base_folder_name.startswith(last_part_norm) or
-                                        last_part_norm.startswith(base_folder_name) or
-                                        # Also check parent directory if it's not a common prefix folder
-                                        (parent_part and parent_part not in ["prefixes", "wine", "pfx"] and (
-                                            parent_part.lower() == game_name.lower() or
-                                            parent_part_norm == normalized_game_name or
-                                            normalized_game_name in parent_part_norm or
-                                            parent_part_norm in normalized_game_name or
-                                            base_folder_name.startswith(parent_part_norm) or
-                                            parent_part_norm.startswith(base_folder_name)))):
-                                        
-                                        match_type = "last_part" if (last_part.lower() == game_name.lower() or 
-                                                                    last_part_norm == normalized_game_name or
-                                                                    normalized_game_name in last_part_norm or
-                                                                    last_part_norm in normalized_game_name) else "parent_part"
-                                        
-                                        decky.logger.info(f"Found match via winePrefix {match_type}: {wine_prefix}")
-                                        decky.logger.info(f"Config file: {config_file}, key: {app_key}")
-                                        return {
-                                            "status": "success",
-                                            "config_file": config_file,
-                                            "config_key": app_key
-                                        }
-                    except Exception as e:
-                        decky.logger.error(f"Error reading config file {config_file}: {str(e)}")
+                            # Normalize for matching
+                            last_part_norm = _normalize_string(last_part)
+                            parent_part_norm = _normalize_string(parent_part)
+                            
+                            # Enhanced matching for Wine prefix components
+                            if (last_part.lower() == game_name.lower() or
+                                last_part_norm == normalized_game_name or
+                                normalized_game_name in last_part_norm or
+                                last_part_norm in normalized_game_name or
+                                base_folder_name.startswith(last_part_norm) or
+                                last_part_norm.startswith(base_folder_name) or
+                                # Also check parent directory if it's not a common prefix folder
+                                (parent_part and parent_part not in ["prefixes", "wine", "pfx"] and (
+                                    parent_part.lower() == game_name.lower() or
+                                    parent_part_norm == normalized_game_name or
+                                    normalized_game_name in parent_part_norm or
+                                    parent_part_norm in normalized_game_name or
+                                    base_folder_name.startswith(parent_part_norm) or
+                                    parent_part_norm.startswith(base_folder_name)))):
+                                
+                                match_type = "last_part" if (last_part.lower() == game_name.lower() or 
+                                                            last_part_norm == normalized_game_name or
+                                                            normalized_game_name in last_part_norm or
+                                                            last_part_norm in normalized_game_name) else "parent_part"
+                                
+                                decky.logger.info(f"Found match via winePrefix {match_type}: {wine_prefix}")
+                                decky.logger.info(f"Config file: {config_file}, key: {app_key}")
+                                return {
+                                    "status": "success",
+                                    "config_file": config_file,
+                                    "config_key": app_key
+                                }
             
             # Improved executable name matching
             decky.logger.info("Trying enhanced matching using executable names...")
@@ -1826,8 +2346,8 @@ class Plugin:
             exe_files = []
             try:
                 for file in os.listdir(exe_dir):
-                    if file.lower().endswith(".exe") and not any(skip in file.lower() for skip in 
-                                                            ["unins", "launcher", "crash", "setup", "config", "redist"]):
+                    file_lower = file.lower()
+                    if file_lower.endswith(".exe") and not _SKIP_UTILITY_RE.search(file_lower):
                         exe_files.append(file)
                         
                 # Try additional subdirectories if no EXEs found in main directory
@@ -1836,114 +2356,92 @@ class Plugin:
                         subdir_path = os.path.join(exe_dir, subdir)
                         if os.path.exists(subdir_path) and os.path.isdir(subdir_path):
                             for file in os.listdir(subdir_path):
-                                if file.lower().endswith(".exe") and not any(skip in file.lower() for skip in 
-                                                                        ["unins", "launcher", "crash", "setup", "config", "redist"]):
+                                file_lower = file.lower()
+                                if file_lower.endswith(".exe") and not _SKIP_UTILITY_RE.search(file_lower):
                                     exe_files.append(file)
                                     decky.logger.info(f"Found exe in subdirectory {subdir}: {file}")
             except Exception as e:
                 decky.logger.error(f"Error listing executable directory: {str(e)}")
                 
             if exe_files:
-                # Use all executable names for matching, not just the first one
-                games_config_dir = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/GamesConfig")
-                
-                for exe_file in exe_files:
-                    # Get name without .exe extension
-                    exe_name = os.path.splitext(exe_file)[0].lower()
-                    exe_name_norm = exe_name.replace(" ", "").replace("-", "").replace("_", "")
-                    
-                    decky.logger.info(f"Trying to match using executable: {exe_name}")
-                    
-                    # Check all config files for matches
-                    for config_file in os.listdir(games_config_dir):
-                        if not config_file.endswith(".json"):
+                # Normalize every executable stem once up front; exact matches
+                # become one set lookup per config title instead of an extra
+                # pass over all configs for each executable
+                exe_stems = {os.path.splitext(f)[0].lower() for f in exe_files}
+                exe_norms = {_normalize_string(stem) for stem in exe_stems}
+                decky.logger.info(f"Trying to match using executables: {sorted(exe_stems)}")
+                
+                for config_file, config_data in self._iter_game_configs():
+                    # Check all games in this config
+                    for app_key, app_config in config_data.items():
+                        if not isinstance(app_config, dict):
                             continue
-                            
-                        config_file_path = os.path.join(games_config_dir, config_file)
-                        try:
-                            with open(config_file_path, 'r', encoding='utf-8') as f:
-                                config_data = json.load(f)
-                                
-                                # Check all games in this config
-                                for app_key, app_config in config_data.items():
-                                    # Get game info and any other relevant fields that might contain the game name
-                                    game_info = app_config.get("game", {})
-                                    config_title = game_info.get("title", "").lower()
-                                    config_title_norm = config_title.replace(" ", "").replace("-", "").replace("_", "")
-                                    
-                                    # Also check the app config directly for game name
-                                    app_title = app_config.get("title", "").lower()
-                                    app_title_norm = app_title.replace(" ", "").replace("-", "").replace("_", "")
-                                    
-                                    # Enhanced matching for executable names
-                                    if (exe_name == config_title.lower() or
-                                        exe_name_norm == config_title_norm or
-                                        exe_name == app_title.lower() or
-                                        exe_name_norm == app_title_norm or
-                                        exe_name_norm in config_title_norm or
-                                        exe_name_norm in app_title_norm or
-                                        config_title_norm in exe_name_norm or
-                                        app_title_norm in exe_name_norm):
-                                        
-                                        match_source = "game_info" if exe_name_norm in config_title_norm else "app_config"
-                                        match_type = "exact" if (exe_name == config_title.lower() or exe_name == app_title.lower()) else "partial"
-                                        
-                                        decky.logger.info(f"Found match via executable name: {exe_name} matches '{config_title or app_title}' ({match_type} match from {match_source})")
-                                        decky.logger.info(f"Config file: {config_file}, key: {app_key}")
-                                        return {
-                                            "status": "success",
-                                            "config_file": config_file,
-                                            "config_key": app_key
-                                        }
-                        except Exception as e:
-                            decky.logger.error(f"Error reading config file {config_file}: {str(e)}")
+                        # Get game info and any other relevant fields that might contain the game name
+                        game_info = app_config.get("game", {})
+                        config_title = game_info.get("title", "").lower()
+                        config_title_norm = _normalize_string(config_title)
+                        
+                        # Also check the app config directly for game name
+                        app_title = app_config.get("title", "").lower()
+                        app_title_norm = _normalize_string(app_title)
+                        
+                        # Exact matches via set membership, substring checks
+                        # only on the survivors; empty titles never match
+                        exact = (config_title in exe_stems or app_title in exe_stems or
+                                 (config_title_norm and config_title_norm in exe_norms) or
+                                 (app_title_norm and app_title_norm in exe_norms))
+                        partial = not exact and any(
+                            norm in title or title in norm
+                            for title in (config_title_norm, app_title_norm) if title
+                            for norm in exe_norms if norm)
+                        
+                        if exact or partial:
+                            match_type = "exact" if exact else "partial"
+                            decky.logger.info(f"Found match via executable name: '{config_title or app_title}' ({match_type} match)")
+                            decky.logger.info(f"Config file: {config_file}, key: {app_key}")
+                            return {
+                                "status": "success",
+                                "config_file": config_file,
+                                "config_key": app_key
+                            }
                         
             # Check install path as before
             decky.logger.info("Trying to match using install path...")
-            games_config_dir = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/GamesConfig")
-            for config_file in os.listdir(games_config_dir):
-                if not config_file.endswith(".json"):
-                    continue
-                    
-                config_file_path = os.path.join(games_config_dir, config_file)
-                try:
-                    with open(config_file_path, 'r', encoding='utf-8') as f:
-                        config_data = json.load(f)
+            for config_file, config_data in self._iter_game_configs():
+                # Check all games in this config
+                for app_key, app_config in config_data.items():
+                    if not isinstance(app_config, dict):
+                        continue
+                    install_path = app_config.get("installPath", "")
+                    if install_path:
+                        normalized_install_path = os.path.normpath(install_path)
+                        install_folder = os.path.basename(normalized_install_path).lower()
+                        install_folder_norm = _normalize_string(install_folder)
                         
-                        # Check all games in this config
-                        for app_key, app_config in config_data.items():
-                            install_path = app_config.get("installPath", "")
-                            if install_path:
-                                normalized_install_path = os.path.normpath(install_path)
-                                install_folder = os.path.basename(normalized_install_path).lower()
-                                install_folder_norm = install_folder.replace(" ", "").replace("-", "").replace("_", "")
-                                
-                                # Enhanced matching for install paths
-                                if (normalized_install_path == normalized_game_path or
-                                    install_folder == base_folder_name or
-                                    (normalized_game_name in install_folder_norm) or
-                                    (install_folder_norm in normalized_game_name) or
-                                    base_folder_name.startswith(install_folder_norm) or
-                                    install_folder_norm.startswith(base_folder_name)):
-                                    
-                                    decky.logger.info(f"Found match via install path: {install_path}")
-                                    decky.logger.info(f"Config file: {config_file}, key: {app_key}")
-                                    return {
-                                        "status": "success",
-                                        "config_file": config_file,
-                                        "config_key": app_key
-                                    }
-                except Exception as e:
-                    decky.logger.error(f"Error reading config file {config_file}: {str(e)}")
+                        # Enhanced matching for install paths
+                        if (normalized_install_path == normalized_game_path or
+                            install_folder == base_folder_name or
+                            (normalized_game_name in install_folder_norm) or
+                            (install_folder_norm in normalized_game_name) or
+                            base_folder_name.startswith(install_folder_norm) or
+                            install_folder_norm.startswith(base_folder_name)):
+                            
+                            decky.logger.info(f"Found match via install path: {install_path}")
+                            decky.logger.info(f"Config file: {config_file}, key: {app_key}")
+                            return {
+                                "status": "success",
+                                "config_file": config_file,
+                                "config_key": app_key
+                            }
             
             # NEW FALLBACK: Check store-specific installed.json files if all other methods fail
             decky.logger.info("Trying to find game in store-specific installed.json files...")
             
             # Define paths to different store installed.json files
             installed_json_paths = {
-                "epic": os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/legendaryConfig/legendary/installed.json"),
-                "gog": os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/gog_store/installed.json"),
-                "amazon": os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/nile_config/nile/installed.json")
+                "epic": f"{_HEROIC_CONFIG}/legendaryConfig/legendary/installed.json",
+                "gog": f"{_HEROIC_CONFIG}/gog_store/installed.json",
+                "amazon": f"{_HEROIC_CONFIG}/nile_config/nile/installed.json"
             }
             
             # Check each store's installed.json file
@@ -1953,8 +2451,8 @@ class Plugin:
                     continue
                     
                 try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        installed_data = json.load(f)
+                    with open(json_path, 'rb') as f:
+                        installed_data = _json_loads(f.read())
                     
                     decky.logger.info(f"Checking {store.upper()} installed.json file")
                     
@@ -1962,7 +2460,7 @@ class Plugin:
                     if store == "epic":
                         for app_id, game_info in installed_data.items():
                             title = game_info.get("title", "").lower()
-                            title_norm = title.replace(" ", "").replace("-", "").replace("_", "")
+                            title_norm = _normalize_string(title)
                             install_path = os.path.normpath(game_info.get("install_path", ""))
                             executable = game_info.get("executable", "").lower()
                             executable_name = os.path.splitext(executable)[0].lower() if executable else ""
@@ -2056,7 +2554,7 @@ class Plugin:
 
     def _find_config_for_app_name(self, app_name: str) -> dict:
         """Find config file containing the specified app_name as a key"""
-        games_config_dir = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/GamesConfig")
+        games_config_dir = f"{_HEROIC_CONFIG}/GamesConfig"
         
         for config_file in os.listdir(games_config_dir):
             if not config_file.endswith(".json"):
@@ -2064,8 +2562,8 @@ class Plugin:
                 
             config_file_path = os.path.join(games_config_dir, config_file)
             try:
-                with open(config_file_path, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
+                with open(config_file_path, 'rb') as f:
+                    config_data = _json_loads(f.read())
                     
                     if app_name in config_data:
                         decky.logger.info(f"Found config file for {app_name}: {config_file}")
@@ -2082,15 +2580,15 @@ class Plugin:
     async def update_heroic_config(self, config_file: str, config_key: str, dll_override: str) -> dict:
         """Update Heroic game configuration with WINEDLLOVERRIDES for ReShade"""
         try:
-            config_path = os.path.expanduser("~/.var/app/com.heroicgameslauncher.hgl/config/heroic/GamesConfig/")
+            config_path = f"{_HEROIC_CONFIG}/GamesConfig/"
             config_file_path = os.path.join(config_path, config_file)
             
             if not os.path.exists(config_file_path):
                 return {"status": "error", "message": f"Config file not found: {config_file}"}
                 
             # Read the config file
-            with open(config_file_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            with open(config_file_path, 'rb') as f:
+                config_data = _json_loads(f.read())
                 
             if config_key not in config_data:
                 return {"status": "error", "message": f"Game config key '{config_key}' not found in config file"}
@@ -2102,22 +2600,26 @@ class Plugin:
                 config_data[config_key][env_key] = []
             
             # Handle WINEDLLOVERRIDES
-            # Remove any existing WINEDLLOVERRIDES
-            config_data[config_key][env_key] = [
-                env for env in config_data[config_key][env_key] 
-                if env.get("key") != "WINEDLLOVERRIDES"
-            ]
+            # Remove any existing WINEDLLOVERRIDES in place (at most one in
+            # practice) instead of rebuilding the whole options list
+            opts = config_data[config_key][env_key]
+            for i in range(len(opts) - 1, -1, -1):
+                if opts[i].get("key") == "WINEDLLOVERRIDES":
+                    del opts[i]
             
             # Add new WINEDLLOVERRIDES if not removing
             if dll_override != "remove":
-                config_data[config_key][env_key].append({
+                opts.append({
                     "key": "WINEDLLOVERRIDES",
                     "value": f"d3dcompiler_47=n;{dll_override}=n,b"
                 })
             
-            # Write back the updated config
+            # Write back the updated config in one buffer write
             with open(config_file_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2)
+                f.write(json.dumps(config_data, indent=2))
+            
+            # The on-disk file changed; drop the cached parse for it
+            self._cfg_cache.pop(config_file_path, None)
                 
             return {"status": "success", "output": f"Updated Heroic config with {dll_override} override."}
         except Exception as e:
@@ -2130,9 +2632,7 @@ class Plugin:
             decky.logger.info(f"Installing ReShade for Heroic game at: {game_path}")
             
             # Verify ReShade is installed
-            marker_file = Path(self.main_path) / ".installed"
-            addon_marker = Path(self.main_path) / ".installed_addon"
-            if not marker_file.exists() and not addon_marker.exists():
+            if not os.path.exists(self._marker_file) and not os.path.exists(self._addon_marker_file):
                 return {"status": "error", "message": "ReShade is not installed. Please install ReShade first."}
             
             # Verify game path exists
@@ -2157,35 +2657,32 @@ class Plugin:
             arch = "64"  # Default to 64-bit
             exe_found = False
             
-            for file in os.listdir(exe_dir):
-                if file.lower().endswith(".exe"):
+            # A user-chosen executable is the main exe by definition; read its
+            # header directly instead of rescanning the directory
+            if selected_executable_path and os.path.exists(selected_executable_path):
+                detected = _detect_pe_arch(selected_executable_path)
+                if detected is not None:
+                    arch = detected
+                    exe_found = True
+                    decky.logger.info(f"Found {detected}-bit executable: {selected_executable_path}")
+
+            if not exe_found:
+                for entry in _scandir_list(exe_dir):
+                    file_lower = entry.name.lower()
+                    if not file_lower.endswith(".exe"):
+                        continue
                     # Skip known utility executables
-                    if any(skip in file.lower() for skip in ["unins", "launcher", "crash", "setup", "config", "redist"]):
+                    if _SKIP_UTILITY_RE.search(file_lower):
                         continue
-                        
+
                     exe_found = True
-                    exe_path = os.path.join(exe_dir, file)
-                    try:
-                        # Check if 32-bit or 64-bit using the 'file' command
-                        # Create environment with required LD_LIBRARY_PATH fix for Decky v3.1.10+
-                        clean_env = os.environ.copy()
-                        clean_env["LD_LIBRARY_PATH"] = ""
-                        
-                        process = subprocess.run(
-                            ["file", exe_path],
-                            capture_output=True,
-                            text=True,
-                            env=clean_env
-                        )
-                        
-                        if "PE32 executable" in process.stdout and "PE32+" not in process.stdout:
-                            arch = "32"
-                            decky.logger.info(f"Found 32-bit executable: {exe_path}")
-                            break
-                        elif "PE32+ executable" in process.stdout or "x86-64" in process.stdout:
-                            decky.logger.info(f"Found 64-bit executable: {exe_path}")
-                    except Exception as e:
-                        decky.logger.error(f"Error checking EXE architecture: {str(e)}")
+                    # Check if 32-bit or 64-bit from the PE header directly; the
+                    # first classified exe decides, so siblings are never probed
+                    detected = _detect_pe_arch(entry.path)
+                    if detected is not None:
+                        arch = detected
+                        decky.logger.info(f"Found {detected}-bit executable: {entry.path}")
+                        break
             
             decky.logger.info(f"Using architecture: {arch}-bit")
             
@@ -2200,26 +2697,45 @@ class Plugin:
             reshade_dll_dst = os.path.join(exe_dir, f"{dll_override}.dll")
             d3dcompiler_dst = os.path.join(exe_dir, "d3dcompiler_47.dll")
             
-            # Copy files instead of creating symlinks
-            shutil.copy2(reshade_dll_src, reshade_dll_dst)
-            shutil.copy2(d3dcompiler_src, d3dcompiler_dst)
+            # Hardlink (or copy) the DLLs instead of creating symlinks
+            _link_or_copy(reshade_dll_src, reshade_dll_dst)
+            _link_or_copy(d3dcompiler_src, d3dcompiler_dst)
             
             # Set proper permissions for DLL files (read/write for all)
             os.chmod(reshade_dll_dst, 0o666)
             os.chmod(d3dcompiler_dst, 0o666)
             
             # Copy shader directory if exists
-            if os.path.exists(os.path.join(self.main_path, "ReShade_shaders")):
+            shaders_src = os.path.join(self.main_path, "ReShade_shaders")
+            if os.path.exists(shaders_src):
                 shaders_dst = os.path.join(exe_dir, "ReShade_shaders")
-                # Check if it already exists
-                if os.path.exists(shaders_dst):
-                    # Remove old link/directory
-                    if os.path.islink(shaders_dst):
-                        os.unlink(shaders_dst)
-                    else:
-                        shutil.rmtree(shaders_dst)
-                # Create the directory and copy files
-                shutil.copytree(os.path.join(self.main_path, "ReShade_shaders"), shaders_dst)
+                manifest_dst = os.path.join(shaders_dst, ".manifest")
+
+                # Skip the whole recopy when the previously copied tree came
+                # from an identical source; the fingerprint is stat-only
+                src_fingerprint = _tree_fingerprint(shaders_src)
+                dst_fingerprint = None
+                if not os.path.islink(shaders_dst):
+                    try:
+                        with open(manifest_dst, 'r', encoding='utf-8') as f:
+                            dst_fingerprint = f.read().strip()
+                    except OSError:
+                        pass
+
+                if dst_fingerprint != src_fingerprint:
+                    # Check if it already exists
+                    if os.path.exists(shaders_dst):
+                        # Remove old link/directory
+                        if os.path.islink(shaders_dst):
+                            os.unlink(shaders_dst)
+                        else:
+                            shutil.rmtree(shaders_dst)
+                    # Create the directory and copy files
+                    shutil.copytree(shaders_src, shaders_dst)
+                    with open(manifest_dst, 'w', encoding='utf-8') as f:
+                        f.write(src_fingerprint)
+                else:
+                    decky.logger.info("Shader tree unchanged; skipping recopy")
             
             # Fix ReShade.ini to use local paths instead of system paths
             reshade_ini_src = os.path.join(self.main_path, "ReShade.ini")
@@ -2241,15 +2757,29 @@ class Plugin:
                 # Replace system paths with relative game paths (convert to Windows format for Wine)
                 if merged_path:
                     # For merged shader setup
-                    ini_content = re.sub(r'EffectSearchPaths=.*', r'EffectSearchPaths=.\\ReShade_shaders\\Merged\\Shaders', ini_content)
-                    ini_content = re.sub(r'TextureSearchPaths=.*', r'TextureSearchPaths=.\\ReShade_shaders\\Merged\\Textures', ini_content)
+                    replacements = {
+                        "EffectSearchPaths=": "EffectSearchPaths=.\\ReShade_shaders\\Merged\\Shaders",
+                        "TextureSearchPaths=": "TextureSearchPaths=.\\ReShade_shaders\\Merged\\Textures",
+                        "PresetPath=": "PresetPath=.",
+                    }
                 else:
                     # For individual shader repositories
-                    ini_content = re.sub(r'EffectSearchPaths=.*', r'EffectSearchPaths=.\\ReShade_shaders', ini_content)
-                    ini_content = re.sub(r'TextureSearchPaths=.*', r'TextureSearchPaths=.\\ReShade_shaders', ini_content)
-                    
-                # Update the PresetPath to use the local directory
-                ini_content = re.sub(r'PresetPath=.*', r'PresetPath=.', ini_content)
+                    replacements = {
+                        "EffectSearchPaths=": "EffectSearchPaths=.\\ReShade_shaders",
+                        "TextureSearchPaths=": "TextureSearchPaths=.\\ReShade_shaders",
+                        "PresetPath=": "PresetPath=.",
+                    }
+
+                # One pass over the lines instead of a full-buffer regex
+                # rewrite per key; untouched lines keep their original bytes
+                # and line endings
+                lines = ini_content.splitlines(keepends=True)
+                for i, line in enumerate(lines):
+                    for prefix, replacement in replacements.items():
+                        if line.startswith(prefix):
+                            lines[i] = replacement + "\n"
+                            break
+                ini_content = "".join(lines)
                 
                 # Write the modified ini file with proper permissions
                 with open(reshade_ini_dst, 'w', encoding='utf-8') as f:
@@ -2260,21 +2790,8 @@ class Plugin:
                 
             else:
                 # If no ReShade.ini exists, create a basic one
-                with open(reshade_ini_dst, 'w', encoding='utf-8') as f:
-                    f.write("""[GENERAL]
-EffectSearchPaths=.\\ReShade_shaders
-TextureSearchPaths=.\\ReShade_shaders
-PresetPath=.
-PerformanceMode=0
-PreprocessorDefinitions=
-Effects=
-Techniques=
-
-[INPUT]
-KeyOverlay=36
-KeyNextPreset=0
-KeyPreviousPreset=0
-""")
+                with open(reshade_ini_dst, 'wb') as f:
+                    f.write(_DEFAULT_INI_BYTES)
                 # Set proper permissions (read/write for all)
                 os.chmod(reshade_ini_dst, 0o666)
             
@@ -2284,22 +2801,8 @@ KeyPreviousPreset=0
             # Only create the file if it doesn't already exist (preserve existing user settings)
             if not os.path.exists(reshade_preset_dst):
                 game_name = os.path.basename(game_path)
-                with open(reshade_preset_dst, 'w', encoding='utf-8') as f:
-                    f.write(f"""# ReShade Preset Configuration for {game_name}
-# This file will be automatically populated when you save presets in ReShade
-# Press HOME key in-game to open ReShade overlay
-# Go to Settings -> General -> "Reload all shaders" if shaders don't appear
-
-# Example preset configuration:
-# [Preset1]
-# Techniques=SMAA,Clarity,LumaSharpen
-# PreprocessorDefinitions=
-
-# Uncomment and modify the lines below to create a default preset:
-# [Default]
-# Techniques=
-# PreprocessorDefinitions=
-""")
+                with open(reshade_preset_dst, 'wb') as f:
+                    f.write(_PRESET_TEMPLATE.format(game_name=game_name).encode("utf-8"))
                 
                 # Set proper permissions for ReShadePreset.ini (read/write for all)
                 os.chmod(reshade_preset_dst, 0o666)
@@ -2323,42 +2826,18 @@ KeyPreviousPreset=0
             else:
                 autohdr_status = f"- AutoHDR.addon{arch}: Not compatible with {dll_override} (requires DirectX 10/11/12)"
             
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(f"""ReShade for {os.path.basename(game_path)}
-------------------------------------
-Installed with LetMeReShade plugin for Heroic Games Launcher
-
-DLL Override: {dll_override}
-Architecture: {arch}-bit
-Executable Directory: {exe_dir}
-{f'Selected Executable: {os.path.basename(selected_executable_path)}' if selected_executable_path else 'Auto-detected executable location'}
-
-Press HOME key in-game to open the ReShade overlay.
-
-If shaders are not visible:
-1. Open the ReShade overlay with HOME key
-2. Go to Settings tab
-3. Check paths for "Effect Search Paths" and "Texture Search Paths"
-4. They should point to the ReShade_shaders folder in this game directory
-5. If not, update them to: ".\\ReShade_shaders"
-
-Shader preset files (.ini) will be saved in this game directory.
-
-Files created:
-- ReShade.ini: Main ReShade configuration
-- ReShadePreset.ini: Preset configurations (auto-populated when you save presets)
-- {dll_override}.dll: ReShade DLL
-- d3dcompiler_47.dll: DirectX shader compiler
-- ReShade_shaders/: Shader files directory
-{autohdr_status}
-
-AutoHDR Compatibility:
-- Compatible APIs: DXGI, D3D11, D3D12 (DirectX 10/11/12)
-- Incompatible APIs: D3D9, D3D8, OpenGL32, DDraw, DInput8
-- Current API: {dll_override} {'(✅ AutoHDR Compatible)' if autohdr_compatible else '(❌ AutoHDR Incompatible)'}
-
-Note: If ReShadePreset.ini already existed, your previous settings were preserved.
-""")
+            exe_line = (f"Selected Executable: {os.path.basename(selected_executable_path)}"
+                        if selected_executable_path else "Auto-detected executable location")
+            with open(readme_path, 'wb') as f:
+                f.write(_README_TEMPLATE.format(
+                    game_name=os.path.basename(game_path),
+                    dll_override=dll_override,
+                    arch=arch,
+                    exe_dir=exe_dir,
+                    exe_line=exe_line,
+                    autohdr_status=autohdr_status,
+                    compat_marker="(\u2705 AutoHDR Compatible)" if autohdr_compatible else "(\u274c AutoHDR Incompatible)",
+                ).encode("utf-8"))
             
             # Set proper permissions for README (read/write for all)
             os.chmod(readme_path, 0o666)
@@ -2371,7 +2850,7 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
                 if os.path.exists(autohdr_addon_path):
                     autohdr_dst = os.path.join(exe_dir, f"AutoHDR.addon{arch}")
                     try:
-                        shutil.copy2(autohdr_addon_path, autohdr_dst)
+                        _link_or_copy(autohdr_addon_path, autohdr_dst)
                         os.chmod(autohdr_dst, 0o666)
                         decky.logger.info(f"AutoHDR addon copied successfully for {arch}-bit architecture (API: {dll_override})")
                     except Exception as e:
@@ -2407,69 +2886,88 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
             if not path.exists() or not path.is_dir():
                 return path, 0
                 
-            # Extract words from game name for better matching
-            game_words = set(re.findall(r'\w+', game_name.lower()))
+            # Extract words from game name once for the whole walk
+            game_words = frozenset(w.lower() for w in _TOKEN_RE.findall(game_name))
             # Clean game name (remove spaces, special chars)
-            clean_game_name = re.sub(r'[^a-z0-9]', '', game_name.lower())
+            game_name_lower = game_name.lower()
+            clean_game_name = _NON_ALNUM_RE.sub('', game_name_lower)
+            game_name_nospace = game_name_lower.replace(" ", "")
             
             decky.logger.info(f"Looking for executables for game: {game_name}")
             decky.logger.info(f"Game words for matching: {game_words}")
             
-            def analyze_directory_content(dir_path: Path) -> float:
+            def scan_directory(dir_path: str) -> tuple[list, list, list]:
+                """Single os.scandir pass partitioning entries into subdirs, .exe files and other files
+
+                Using DirEntry type/stat information avoids the extra stat
+                syscalls that Path.glob + is_file + stat would each issue.
+                """
+                subdirs, exe_entries, file_entries = [], [], []
+                try:
+                    with os.scandir(dir_path) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry)
+                                elif entry.is_file(follow_symlinks=False):
+                                    if entry.name.lower().endswith('.exe'):
+                                        exe_entries.append(entry)
+                                    else:
+                                        file_entries.append(entry)
+                            except OSError:
+                                continue
+                except (PermissionError, OSError) as e:
+                    decky.logger.debug(f"Error accessing directory {dir_path}: {e}")
+                return subdirs, exe_entries, file_entries
+
+            def analyze_directory_content(dir_path: str, subdirs: list, exe_entries: list, file_entries: list) -> float:
                 """Score a directory based on its content"""
-                if not dir_path.exists() or not dir_path.is_dir():
-                    return 0
-                    
                 score = 0
-                file_types = {'exe': 0, 'dll': 0, 'config': 0, 'asset': 0, 'setup': 0, 'redist': 0}
-                
+                file_types = {'exe': len(exe_entries), 'dll': 0, 'config': 0, 'asset': 0, 'setup': 0, 'redist': 0}
+
                 try:
                     # Count file types
-                    for file in dir_path.iterdir():
-                        if file.is_file():
-                            ext = file.suffix.lower()
-                            
-                            # Game binary files
-                            if ext == '.exe':
-                                file_types['exe'] += 1
-                            elif ext == '.dll':
-                                file_types['dll'] += 1
-                                
-                            # Game config and data files
-                            elif ext in ['.ini', '.cfg', '.xml', '.json', '.txt']:
-                                file_types['config'] += 1
-                                
-                            # Game asset files
-                            elif ext in ['.pak', '.dat', '.bsa', '.ba2', '.dds', '.tga', '.png', '.jpg']:
-                                file_types['asset'] += 1
-                                
-                            # Setup and redistributable files (negative indicators)
-                            elif ext in ['.msi', '.cab', '.msm']:
-                                file_types['setup'] += 1
-                            
-                            # Check file names for redistributable indicators
-                            file_name = file.name.lower()
-                            if any(term in file_name for term in ['redist', 'vcredist', 'directx', 'setup', 'install']):
-                                file_types['redist'] += 1
-                    
+                    for entry in exe_entries + file_entries:
+                        file_name = entry.name.lower()
+                        ext = os.path.splitext(file_name)[1]
+
+                        if ext == '.dll':
+                            file_types['dll'] += 1
+
+                        # Game config and data files
+                        elif ext in ['.ini', '.cfg', '.xml', '.json', '.txt']:
+                            file_types['config'] += 1
+
+                        # Game asset files
+                        elif ext in ['.pak', '.dat', '.bsa', '.ba2', '.dds', '.tga', '.png', '.jpg']:
+                            file_types['asset'] += 1
+
+                        # Setup and redistributable files (negative indicators)
+                        elif ext in ['.msi', '.cab', '.msm']:
+                            file_types['setup'] += 1
+
+                        # Check file names for redistributable indicators
+                        if any(term in file_name for term in ['redist', 'vcredist', 'directx', 'setup', 'install']):
+                            file_types['redist'] += 1
+
                     # Score based on file types
                     # Game directories usually have more DLLs and game-related files
                     score += file_types['dll'] * 0.5  # DLLs are good indicators
                     score += file_types['config'] * 0.3  # Config files are somewhat good indicators
                     score += file_types['asset'] * 0.4  # Asset files are good indicators
-                    
+
                     # Too many EXEs might indicate a utility directory
                     if file_types['exe'] > 5:
                         score -= (file_types['exe'] - 5) * 0.2
-                    
+
                     # Setup files are negative indicators
                     score -= file_types['setup'] * 1.0
                     score -= file_types['redist'] * 1.0
-                    
+
                     # Check directory name - look for similarity to game name
-                    dir_name = dir_path.name.lower()
-                    clean_dir_name = re.sub(r'[^a-z0-9]', '', dir_name)
-                    
+                    dir_name = os.path.basename(dir_path).lower()
+                    clean_dir_name = _NON_ALNUM_RE.sub('', dir_name)
+
                     # Increase score for directories that match game name
                     if clean_dir_name == clean_game_name:
                         score += 3  # Exact match
@@ -2479,42 +2977,41 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
                         score += 2  # Common game directories
                     elif any(term in dir_name for term in ['redist', 'setup', 'support', 'tools', 'eadm']):
                         score -= 2  # Negative indicators
-                    
+
                     # Analyze subdirectory names
-                    subdirs = [d for d in dir_path.iterdir() if d.is_dir()]
                     subdir_names = [d.name.lower() for d in subdirs]
-                    
+
                     # Game directories often have these subdirectories
                     game_subdir_indicators = ['data', 'config', 'save', 'content', 'assets', 'levels']
                     for indicator in game_subdir_indicators:
                         if any(indicator in name for name in subdir_names):
                             score += 0.5
-                    
+
                     # Round to 1 decimal place
                     score = round(score, 1)
                     decky.logger.debug(f"Directory content score for {dir_path}: {score}")
                     return score
-                    
+
                 except (PermissionError, OSError) as e:
                     decky.logger.debug(f"Error analyzing directory {dir_path}: {e}")
                     return 0
             
-            def score_executable(exe_path: Path) -> float:
+            def score_executable(exe_entry: os.DirEntry) -> float:
                 """Score an executable based on how likely it is to be the main game executable"""
-                if not exe_path.is_file():
-                    return 0
-                    
-                name = exe_path.stem.lower()
+                # The walker only yields names ending in ".exe", so slicing the
+                # extension off beats a splitext call per candidate
+                stem = exe_entry.name[:-4]
+                name = stem.lower()
                 score = 0
                 
                 # Skip utility executables
-                if any(skip in name for skip in ["unins", "launcher", "crash", "setup", "config", "redist", "install"]):
+                if _SKIP_RE.search(name):
                     return 0
                     
                 decky.logger.debug(f"Scoring executable: {name}")
                 
                 # Enhanced name matching for specific cases
-                clean_exe_name = re.sub(r'[^a-z0-9]', '', name)
+                clean_exe_name = _NON_ALNUM_RE.sub('', name)
                 
                 # Check exact match (normalized)
                 if clean_exe_name == clean_game_name:
@@ -2523,7 +3020,7 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
                     score += exact_match_score
                 
                 # Handle special cases like "among us.exe" vs "amongus"
-                elif name.replace(" ", "") == game_name.lower() or game_name.lower().replace(" ", "") == name:
+                elif name.replace(" ", "") == game_name_lower or game_name_nospace == name:
                     special_match_score = 25
                     decky.logger.debug(f"  Special space-normalized match: +{special_match_score}")
                     score += special_match_score
@@ -2543,7 +3040,7 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
                 # Word-based matching
                 else:
                     # Name matching with game name
-                    name_words = set(re.findall(r'\w+', name))
+                    name_words = {w.lower() for w in _TOKEN_RE.findall(stem)}
                     
                     # Calculate word match score based on intersection
                     matching_words = game_words.intersection(name_words)
@@ -2557,19 +3054,19 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
                         score += word_score
                 
                 # Bonus for common game executable names (increased)
-                if name.lower() in ["game", "start", "play", "client", "app"]:
+                if name in _COMMON_EXE_NAMES:
                     common_name_score = 5.0  # Increased from 0.5 to 5.0
                     decky.logger.debug(f"  Common name bonus: +{common_name_score} ({name})")
                     score += common_name_score
                 
                 try:
                     # File size is still a factor, but MUCH less important than name matching
-                    size = exe_path.stat().st_size
+                    # DirEntry.stat() reuses the cached result from the scandir pass
+                    size = exe_entry.stat(follow_symlinks=False).st_size
                     size_mb = size / (1024 * 1024)
                     
                     # Reduced logarithmic scoring for size - much lower weight
                     if size_mb > 0:
-                        import math
                         size_score = min(0.5, math.log10(size_mb) / 6)  # Significantly reduced weight for size
                         size_score = round(size_score, 1)  # Round to 1 decimal
                         decky.logger.debug(f"  Size score: +{size_score} ({size_mb:.2f} MB)")
@@ -2595,59 +3092,89 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
                 decky.logger.debug(f"  Final executable score: {score}")
                 return score
             
-            def find_best_exe_dir(path: Path, max_depth=3, current_depth=0) -> tuple[Path, float]:
-                """Recursively find the best executable directory"""
-                if not path.exists() or not path.is_dir():
-                    return None, 0
-                    
+            def find_best_exe_dir(base_path: Path, max_depth=3) -> tuple[Path, float]:
+                """Find the best executable directory with an iterative BFS
+
+                The walk stops as soon as a directory scores confidently
+                enough, so sibling subtrees are skipped once a good match is
+                known and there is no recursion-depth risk on pathological
+                installs.
+                """
+                GOOD_ENOUGH_SCORE = 5
+                MAX_DIRS_VISITED = 5000
+
                 best_exe_dir = None
                 best_score = -1
-                
-                try:
+                dirs_visited = 0
+
+                # Work with plain string paths in the walk; pathlib joins are
+                # an order of magnitude more expensive per entry
+                queue = deque([(str(base_path), 0)])
+                while queue:
+                    path, depth = queue.popleft()
+
+                    # Hard cap so pathological installs can't stall the walk
+                    dirs_visited += 1
+                    if dirs_visited > MAX_DIRS_VISITED:
+                        decky.logger.warning(f"Directory walk cap reached under {base_path}")
+                        break
+
+                    # Single scandir pass replaces the old glob + iterdir walks
+                    subdirs, exe_entries, file_entries = scan_directory(path)
+
+                    # Score likely candidates first: an exe whose name holds
+                    # a game word is almost always the winner, and scoring it
+                    # early lets the short-circuit below skip the rest
+                    if len(exe_entries) > 1 and game_words:
+                        exe_entries.sort(
+                            key=lambda e: not any(w in e.name.lower() for w in game_words))
+
                     # First check for executables in this directory
-                    exes_in_dir = []
-                    for exe in path.glob("*.exe"):
-                        exe_score = score_executable(exe)
-                        if exe_score > 0:
-                            exes_in_dir.append((exe, exe_score))
-                    
+                    best_exe_entry = None
+                    best_exe_score = 0
+                    for exe_entry in exe_entries:
+                        exe_score = score_executable(exe_entry)
+                        if exe_score > best_exe_score:
+                            best_exe_entry = exe_entry
+                            best_exe_score = exe_score
+                            # Strong match; no need to score the siblings too
+                            if exe_score >= GOOD_ENOUGH_SCORE:
+                                break
+
                     # Get directory content score
-                    dir_content_score = analyze_directory_content(path)
-                    
-                    # Sort executables by score (highest first)
-                    exes_in_dir.sort(key=lambda x: x[1], reverse=True)
-                    
+                    dir_content_score = analyze_directory_content(path, subdirs, exe_entries, file_entries)
+
                     # Calculate combined score for this directory
-                    if exes_in_dir:
-                        best_exe_score = exes_in_dir[0][1]
+                    if best_exe_entry is not None:
                         combined_score = best_exe_score + dir_content_score
-                        decky.logger.debug(f"Directory {path} - Best exe: {exes_in_dir[0][0].name} (score: {best_exe_score:.1f}), Dir content: {dir_content_score:.1f}, Combined: {combined_score:.1f}")
-                        
+                        decky.logger.debug(f"Directory {path} - Best exe: {best_exe_entry.name} (score: {best_exe_score:.1f}), Dir content: {dir_content_score:.1f}, Combined: {combined_score:.1f}")
+
                         if combined_score > best_score:
                             best_score = combined_score
                             best_exe_dir = path
+
+                        # Confident match - no need to walk the rest of the tree
+                        if combined_score >= GOOD_ENOUGH_SCORE:
+                            break
                     else:
                         # If no executables, just use the directory content score
                         if dir_content_score > best_score:
                             best_score = dir_content_score
                             best_exe_dir = path
-                    
-                    # If we haven't found a good match and have depth remaining, check subdirectories
-                    if (best_score < 4 or current_depth == 0) and current_depth < max_depth:
-                        for subdir in path.iterdir():
-                            if subdir.is_dir():
-                                sub_exe_dir, sub_score = find_best_exe_dir(subdir, max_depth, current_depth + 1)
-                                if sub_score > best_score:
-                                    best_score = sub_score
-                                    best_exe_dir = sub_exe_dir
-                
-                except (PermissionError, OSError) as e:
-                    decky.logger.debug(f"Error accessing directory {path}: {e}")
-                
+
+                    # If we haven't found a good match and have depth remaining, queue subdirectories
+                    if (best_score < 4 or depth == 0) and depth < max_depth:
+                        for subdir in subdirs:
+                            # Hidden, system and runtime dirs never hold the game exe
+                            name = subdir.name
+                            if name[0] in ".$" or name.lower() in _SKIP_DIR_NAMES:
+                                continue
+                            queue.append((subdir.path, depth + 1))
+
                 # Round final score to 1 decimal
                 best_score = round(best_score, 1)
-                
-                return best_exe_dir, best_score
+
+                return (Path(best_exe_dir) if best_exe_dir else None), best_score
                 
             # Find the best executable directory
             best_dir, score = find_best_exe_dir(path)
@@ -2680,12 +3207,17 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
             # If we couldn't find anything, check some common subdirectories
             common_dirs = ["bin", "bin32", "bin64", "binaries", "game", "win64", "win32", "x64", "x86"]
             for common in common_dirs:
-                test_path = game_path / common
-                if test_path.exists() and test_path.is_dir():
-                    exes = list(test_path.glob("*.exe"))
-                    if exes:
-                        decky.logger.info(f"Using common executable directory: {test_path}")
-                        return str(test_path)
+                test_path = f"{game_path}/{common}"
+                # One scandir answers exists/is_dir/has-exe in a single pass,
+                # stopping at the first .exe instead of globbing them all
+                try:
+                    with os.scandir(test_path) as it:
+                        has_exe = any(e.name.endswith(".exe") for e in it)
+                except OSError:
+                    continue
+                if has_exe:
+                    decky.logger.info(f"Using common executable directory: {test_path}")
+                    return test_path
             
             # If we still didn't find anything, just use the original path
             decky.logger.info(f"No suitable executable directory found, using original path: {game_path}")
@@ -2695,54 +3227,216 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
             decky.logger.error(f"Error finding game executable directory: {str(e)}")
             return None
 
-    def _find_game_path(self, appid: str) -> str:
-        steam_root = Path(decky.HOME) / ".steam" / "steam"
-        library_file = steam_root / "steamapps" / "libraryfolders.vdf"
+    def _parse_manifest(self, manifest_path: str, library_path: str) -> dict:
+        """Extract the keys we need from one appmanifest_*.acf file"""
+        game_info = {"appid": None, "name": None, "installdir": None, "library": library_path}
+        try:
+            with _open_noatime(manifest_path) as f:
+                # appid/name/installdir sit near the top of the manifest, so
+                # one small read covers almost every file; only fall back to
+                # the full file (depot/install-script blocks) when needed
+                manifest_data = f.read(4096)
+                while True:
+                    for m in _VDF_KV.finditer(manifest_data):
+                        key = m.group(1)
+                        if key == b"path":
+                            continue
+                        value = m.group(2).replace(b'\\"', b'"').decode("utf-8", errors="replace")
+                        game_info[key.decode()] = value
+                        # All three keys sit in the header; stop the scan as
+                        # soon as the last one is captured
+                        if game_info["appid"] and game_info["name"] and game_info["installdir"]:
+                            break
+
+                    if game_info["appid"] and game_info["name"] and game_info["installdir"]:
+                        break
 
-        if not library_file.exists():
+                    rest = f.read()
+                    if not rest:
+                        break
+                    manifest_data += rest
+        except OSError as e:
+            decky.logger.warning(f"Error reading manifest {manifest_path}: {e}")
+            return None
+
+        return game_info if game_info["appid"] else None
+
+    def _load_steam_index(self) -> dict:
+        """Parse libraryfolders.vdf and every appmanifest once, memoized on the vdf mtime"""
+        library_file = self._libvdf_path
+
+        try:
+            st = os.stat(library_file)
+        except OSError:
             raise ValueError(f"Steam library file not found: {library_file}")
 
-        library_paths = []
-        with open(library_file, "r", encoding="utf-8") as file:
-            for line in file:
-                if '"path"' in line:
-                    path = line.split('"path"')[1].strip().strip('"').replace("\\\\", "/")
-                    library_paths.append(path)
+        libvdf_stat = (st.st_mtime_ns, st.st_size)
+        if self._manifest_cache is not None and libvdf_stat == self._libvdf_stat:
+            return self._manifest_cache
 
+        library_paths = []
+        appid_to_library = {}
+        with _open_noatime(library_file) as f:
+            try:
+                # Scan the mapped file directly; no intermediate bytes copy
+                # and no per-line string allocation
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for m in _VDF_LIB_KV.finditer(mm):
+                        if m.group(1) == b"path":
+                            # VDF escapes backslashes; translate on the
+                            # captured bytes, not on every scanned line
+                            path = m.group(2).replace(b"\\\\", b"/").decode("utf-8", errors="replace")
+                            library_paths.append(path)
+                        elif library_paths:
+                            # Numeric key inside the current library's "apps"
+                            # block; remember which library owns the appid
+                            appid_to_library[m.group(1).decode("ascii")] = library_paths[-1]
+            except ValueError:
+                pass  # empty file
+
+        manifest_paths = []
+        manifest_libraries = []
+        manifest_mtimes = []
+        index = {}
+        new_parse_cache = {}
         for library_path in library_paths:
-            manifest_path = Path(library_path) / "steamapps" / f"appmanifest_{appid}.acf"
-            if manifest_path.exists():
-                with open(manifest_path, "r", encoding="utf-8") as manifest:
-                    for line in manifest:
-                        if '"installdir"' in line:
-                            install_dir = line.split('"installdir"')[1].strip().strip('"')
-                            base_path = Path(library_path) / "steamapps" / "common" / install_dir
-                            
-                            # Get name of the game directory for smarter exe matching
-                            game_name = install_dir.lower().replace("_", " ").replace("-", " ")
-                            
-                            decky.logger.info(f"Finding executable directory for Steam game: {game_name}")
-                            
-                            # Use the unified game executable detection function
-                            best_dir, score = self._find_game_executable_directory(base_path, game_name)
-                            
-                            if best_dir and score > 0:
-                                decky.logger.info(f"Found game executable directory: {best_dir} (score: {score:.2f})")
-                                return str(best_dir)
-                            
-                            # If we couldn't find anything, check some common subdirectories
-                            common_dirs = ["bin", "bin32", "bin64", "binaries", "game", "win64", "win32", "x64", "x86"]
-                            for common in common_dirs:
-                                test_path = base_path / common
-                                if test_path.exists() and test_path.is_dir():
-                                    exes = list(test_path.glob("*.exe"))
-                                    if exes:
-                                        decky.logger.info(f"Using common executable directory: {test_path}")
-                                        return str(test_path)
-                            
-                            # If we still didn't find anything, just use the original path
-                            decky.logger.info(f"No suitable executable directory found, using base path: {base_path}")
-                            return str(base_path)
+            steamapps_path = f"{library_path}/steamapps"
+            try:
+                entries = os.scandir(steamapps_path)
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    # Cheap prefix/suffix test instead of fnmatch-style glob
+                    if not (name.startswith("appmanifest_") and name.endswith(".acf")):
+                        continue
+
+                    # The appid is right there in the filename; skip known
+                    # Valve runtimes before spending a file read on them
+                    appid = name[len("appmanifest_"):-len(".acf")]
+                    if appid in _IGNORED_APPIDS:
+                        continue
+
+                    try:
+                        mtime_ns = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+
+                    manifest_path = entry.path
+
+                    # Reuse the previous parse when the manifest is unchanged
+                    cached = self._manifest_parse_cache.get(manifest_path)
+                    if cached is not None and cached[0] == mtime_ns:
+                        new_parse_cache[manifest_path] = cached
+                        game_info = cached[1]
+                        if game_info is not None:
+                            index[game_info["appid"]] = game_info
+                        continue
+
+                    manifest_paths.append(manifest_path)
+                    manifest_libraries.append(library_path)
+                    manifest_mtimes.append(mtime_ns)
+
+        # Manifest reads are pure I/O, so parse the changed ones concurrently
+        for manifest_path, mtime_ns, game_info in zip(
+                manifest_paths, manifest_mtimes,
+                self._io_pool.map(self._parse_manifest, manifest_paths, manifest_libraries)):
+            new_parse_cache[manifest_path] = (mtime_ns, game_info)
+            if game_info is not None:
+                index[game_info["appid"]] = game_info
+
+        self._manifest_parse_cache = new_parse_cache
+        self._manifest_cache = index
+        self._library_paths = library_paths
+        self._appid_to_library = appid_to_library
+        self._libvdf_stat = libvdf_stat
+        return index
+
+    def _get_library_paths(self) -> list:
+        """Steam library roots from the shared libraryfolders.vdf cache"""
+        self._load_steam_index()
+        return self._library_paths
+
+    async def _find_game_path(self, appid: str) -> str:
+        # The sync body does real file I/O; keep it off the decky event loop
+        return await asyncio.to_thread(self._find_game_path_sync, appid)
+
+    def _find_game_path_sync(self, appid: str) -> str:
+        index = self._load_steam_index()
+        game_info = index.get(appid)
+
+        if game_info is None:
+            # The vdf "apps" block already names the owning library; go there
+            # directly and keep the every-library probe only as a fallback for
+            # legacy libraryfolders.vdf layouts without apps blocks.
+            known_library = self._appid_to_library.get(appid)
+            probe_paths = [known_library] if known_library else self._get_library_paths()
+            # A fresh install adds an appmanifest without necessarily touching
+            # libraryfolders.vdf, so probe each cached library directly
+            for library_path in probe_paths:
+                manifest_path = f"{library_path}/steamapps/appmanifest_{appid}.acf"
+                if os.path.exists(manifest_path):
+                    game_info = self._parse_manifest(manifest_path, library_path)
+                    if game_info:
+                        index[appid] = game_info
+                    break
+
+        if game_info and game_info["installdir"]:
+            install_dir = game_info["installdir"]
+            base_path = Path(game_info["library"]) / "steamapps" / "common" / install_dir
+
+            # A patch or update bumps the install dir's mtime, so it keys a
+            # safe memo of the resolved directory: repeat lookups for the
+            # same game cost one stat instead of a scoring walk
+            try:
+                cache_key = (str(base_path), os.stat(base_path).st_mtime_ns)
+            except OSError:
+                cache_key = None
+            if cache_key is not None:
+                cached_dir = self._best_exe_cache.get(cache_key)
+                if cached_dir is not None:
+                    return cached_dir
+
+            # Get name of the game directory for smarter exe matching
+            game_name = install_dir.lower().replace("_", " ").replace("-", " ")
+
+            decky.logger.info(f"Finding executable directory for Steam game: {game_name}")
+
+            # Use the unified game executable detection function
+            best_dir, score = self._find_game_executable_directory(base_path, game_name)
+
+            resolved = None
+            if best_dir and score > 0:
+                decky.logger.info(f"Found game executable directory: {best_dir} (score: {score:.2f})")
+                resolved = str(best_dir)
+
+            if resolved is None:
+                # If we couldn't find anything, check some common subdirectories
+                common_dirs = ["bin", "bin32", "bin64", "binaries", "game", "win64", "win32", "x64", "x86"]
+                for common in common_dirs:
+                    test_path = f"{base_path}/{common}"
+                    # One scandir answers exists/is_dir/has-exe in a single pass,
+                    # stopping at the first .exe instead of globbing them all
+                    try:
+                        with os.scandir(test_path) as it:
+                            has_exe = any(e.name.endswith(".exe") for e in it)
+                    except OSError:
+                        continue
+                    if has_exe:
+                        decky.logger.info(f"Using common executable directory: {test_path}")
+                        resolved = test_path
+                        break
+
+            if resolved is None:
+                # If we still didn't find anything, just use the original path
+                decky.logger.info(f"No suitable executable directory found, using base path: {base_path}")
+                resolved = str(base_path)
+
+            if cache_key is not None:
+                self._best_exe_cache[cache_key] = resolved
+            return resolved
 
         raise ValueError(f"Could not find installation directory for AppID: {appid}")
 
@@ -2757,20 +3451,16 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
                 decky.logger.warning(f"Could not find executable directory, using provided path: {game_path}")
                 exe_dir = game_path
             
-            # Remove ReShade files (excluding ReShadePreset.ini to preserve user settings)
-            reshade_files = [
-                "d3d8.dll", "d3d9.dll", "d3d10.dll", "d3d11.dll", "d3d12.dll", 
-                "dxgi.dll", "opengl32.dll", "dinput8.dll", "ddraw.dll",
-                "d3dcompiler_47.dll", "ReShade.ini", "ReShade_README.txt",
-                "AutoHDR.addon32", "AutoHDR.addon64"
-                # Note: ReShadePreset.ini is intentionally excluded to preserve user settings
-            ]
-            
-            for file in reshade_files:
-                file_path = os.path.join(exe_dir, file)
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    decky.logger.info(f"Removed {file_path}")
+            # Remove ReShade files (excluding ReShadePreset.ini to preserve
+            # user settings): one directory read instead of an exists probe
+            # per known filename
+            for entry in _scandir_list(exe_dir):
+                if entry.name in _RESHADE_FILES:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        continue
+                    decky.logger.info(f"Removed {entry.path}")
             
             # Remove ReShade_shaders directory if it exists
             shaders_path = os.path.join(exe_dir, "ReShade_shaders")
@@ -2806,115 +3496,102 @@ Note: If ReShadePreset.ini already existed, your previous settings were preserve
             detected_api = "dxgi"
             arch = "64"  # Default to 64-bit
             
-            # Find all executable files
-            exe_files = []
-            for root, _, files in os.walk(game_path):
-                for file in files:
-                    if file.lower().endswith(".exe"):
-                        # Skip known utility executables
-                        if any(skip in file.lower() for skip in ["unins", "launcher", "crash", "setup", "config", "redist"]):
-                            continue
-                        
-                        exe_path = os.path.join(root, file)
-                        file_size = os.path.getsize(exe_path)
-                        
-                        # Larger files are more likely to be the main executable
-                        if file_size > 1024 * 1024:  # Files larger than 1MB
-                            exe_files.append((exe_path, file_size))
-            
-            # Sort by file size (descending)
-            exe_files.sort(key=lambda x: x[1], reverse=True)
-            
+            # Keep only the three largest executables as the walk runs: a
+            # bounded min-heap replaces collecting every candidate and
+            # selecting afterwards
+            top_exes = []
+            for entry in _iter_exe_entries(game_path):
+                # Skip known utility executables
+                if _SKIP_UTILITY_RE.search(entry.name.lower()):
+                    continue
+
+                try:
+                    file_size = entry.stat().st_size
+                except OSError:
+                    continue
+
+                # Larger files are more likely to be the main executable
+                if file_size <= 1024 * 1024:  # Ignore files of 1MB and under
+                    continue
+                if len(top_exes) < 3:
+                    heapq.heappush(top_exes, (file_size, entry.path))
+                else:
+                    heapq.heappushpop(top_exes, (file_size, entry.path))
+
             # Process the largest executable files first
-            for exe_path, _ in exe_files[:3]:  # Check the top 3 largest executables
+            for _, exe_path in sorted(top_exes, reverse=True):
                 decky.logger.info(f"Analyzing executable: {exe_path}")
                 
-                # Check architecture
-                try:
-                    # Create environment with required LD_LIBRARY_PATH fix for Decky v3.1.10+
-                    clean_env = os.environ.copy()
-                    clean_env["LD_LIBRARY_PATH"] = ""
-                    
-                    process = subprocess.run(
-                        ["file", exe_path],
-                        capture_output=True,
-                        text=True,
-                        env=clean_env
-                    )
-                    
-                    if "PE32 executable" in process.stdout and "PE32+" not in process.stdout:
-                        arch = "32"
-                        decky.logger.info(f"Detected 32-bit executable: {exe_path}")
-                    elif "PE32+ executable" in process.stdout or "x86-64" in process.stdout:
-                        arch = "64"
-                        decky.logger.info(f"Detected 64-bit executable: {exe_path}")
-                except Exception as e:
-                    decky.logger.error(f"Error checking architecture: {str(e)}")
+                # Check architecture straight from the PE header - ten bytes
+                # read in-process instead of forking file(1) per candidate
+                pe_arch = _detect_pe_arch(exe_path)
+                if pe_arch is not None:
+                    arch = pe_arch
+                    decky.logger.info(f"Detected {pe_arch}-bit executable: {exe_path}")
+                else:
+                    # Unrecognized header; fall back to file(1) off the loop
+                    try:
+                        process = await asyncio.to_thread(
+                            subprocess.run,
+                            ["file", exe_path],
+                            capture_output=True,
+                            text=True,
+                            env=self._tool_env
+                        )
+
+                        if "PE32 executable" in process.stdout and "PE32+" not in process.stdout:
+                            arch = "32"
+                            decky.logger.info(f"Detected 32-bit executable: {exe_path}")
+                        elif "PE32+ executable" in process.stdout or "x86-64" in process.stdout:
+                            arch = "64"
+                            decky.logger.info(f"Detected 64-bit executable: {exe_path}")
+                    except Exception as e:
+                        decky.logger.error(f"Error checking architecture: {str(e)}")
                 
-                # Look for DLL files in the same directory to determine API
+                # Look for DLL files in the same directory to determine API:
+                # one directory read instead of five separate path stats
                 exe_dir = os.path.dirname(exe_path)
-                
+                local_dlls = {e.name.lower() for e in _scandir_list(exe_dir)
+                              if e.is_file(follow_symlinks=False)}
+
                 # Check for specific DLLs to determine API
-                if os.path.exists(os.path.join(exe_dir, "d3d9.dll")):
+                api_hit = None
+                for dll_name, api in (("d3d9.dll", "d3d9"), ("d3d11.dll", "d3d11"),
+                                      ("d3d8.dll", "d3d8"), ("opengl32.dll", "opengl32"),
+                                      ("dxgi.dll", "dxgi")):
+                    if dll_name in local_dlls:
+                        api_hit = api
+                        decky.logger.info(f"Detected {api} API from {dll_name}")
+                        break
+                if api_hit:
+                    detected_api = api_hit
+                    break
+                
+                # If no DLLs found, read the executable's import table
+                # directly instead of forking objdump over the whole binary
+                imports = await asyncio.to_thread(_pe_imported_dlls, exe_path)
+
+                # Check for DLL imports
+                if "d3d9.dll" in imports:
                     detected_api = "d3d9"
-                    decky.logger.info(f"Detected D3D9 API from d3d9.dll")
+                    decky.logger.info(f"Detected D3D9 API from imports")
                     break
-                elif os.path.exists(os.path.join(exe_dir, "d3d11.dll")):
+                elif "d3d11.dll" in imports:
                     detected_api = "d3d11"
-                    decky.logger.info(f"Detected D3D11 API from d3d11.dll")
+                    decky.logger.info(f"Detected D3D11 API from imports")
                     break
-                elif os.path.exists(os.path.join(exe_dir, "d3d8.dll")):
+                elif "d3d8.dll" in imports:
                     detected_api = "d3d8"
-                    decky.logger.info(f"Detected D3D8 API from d3d8.dll")
+                    decky.logger.info(f"Detected D3D8 API from imports")
                     break
-                elif os.path.exists(os.path.join(exe_dir, "opengl32.dll")):
+                elif "opengl32.dll" in imports:
                     detected_api = "opengl32"
-                    decky.logger.info(f"Detected OpenGL API from opengl32.dll")
+                    decky.logger.info(f"Detected OpenGL API from imports")
                     break
-                elif os.path.exists(os.path.join(exe_dir, "dxgi.dll")):
+                elif "dxgi.dll" in imports:
                     detected_api = "dxgi"
-                    decky.logger.info(f"Detected DXGI API from dxgi.dll")
+                    decky.logger.info(f"Detected DXGI API from imports")
                     break
-                
-                # If no DLLs found, try to analyze the executable for imports
-                try:
-                    # Check imports using objdump (if available)
-                    # Create environment with required LD_LIBRARY_PATH fix for Decky v3.1.10+
-                    clean_env = os.environ.copy()
-                    clean_env["LD_LIBRARY_PATH"] = ""
-                    
-                    process = subprocess.run(
-                        ["objdump", "-p", exe_path],
-                        capture_output=True,
-                        text=True,
-                        env=clean_env
-                    )
-                    
-                    output = process.stdout.lower()
-                    
-                    # Check for DLL imports
-                    if "d3d9.dll" in output:
-                        detected_api = "d3d9"
-                        decky.logger.info(f"Detected D3D9 API from imports")
-                        break
-                    elif "d3d11.dll" in output:
-                        detected_api = "d3d11"
-                        decky.logger.info(f"Detected D3D11 API from imports")
-                        break
-                    elif "d3d8.dll" in output:
-                        detected_api = "d3d8"
-                        decky.logger.info(f"Detected D3D8 API from imports")
-                        break
-                    elif "opengl32.dll" in output:
-                        detected_api = "opengl32"
-                        decky.logger.info(f"Detected OpenGL API from imports")
-                        break
-                    elif "dxgi.dll" in output:
-                        detected_api = "dxgi"
-                        decky.logger.info(f"Detected DXGI API from imports")
-                        break
-                except Exception as e:
-                    decky.logger.error(f"Error analyzing imports: {str(e)}")
             
             # For 32-bit executables, default to d3d9 if not detected
             if arch == "32" and detected_api == "dxgi":